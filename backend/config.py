@@ -11,6 +11,26 @@ BASE_DIR = os.path.dirname(_current_file)
 PROJECT_ROOT = os.path.dirname(BASE_DIR)
 
 
+def get_int_env(name: str, default: int) -> int:
+    """
+    读取整数环境变量
+
+    未设置或无法解析为整数时回退到默认值，而不是在导入时抛出异常。
+    """
+    try:
+        return int(os.getenv(name))
+    except (TypeError, ValueError):
+        return default
+
+
+def get_float_env(name: str, default: float) -> float:
+    """读取浮点数环境变量，未设置或无法解析时回退到默认值"""
+    try:
+        return float(os.getenv(name))
+    except (TypeError, ValueError):
+        return default
+
+
 class Config:
     """基础配置"""
     # Flask 配置
@@ -47,7 +67,7 @@ class Config:
     ZAI_SEARCH_API_KEY = os.getenv('ZAI_SEARCH_API_KEY', '')
     ZAI_SEARCH_API_BASE = os.getenv('ZAI_SEARCH_API_BASE', 'https://open.bigmodel.cn/api/paas/v4/web_search')
     ZAI_SEARCH_ENGINE = os.getenv('ZAI_SEARCH_ENGINE', 'search_pro_quark')
-    ZAI_SEARCH_MAX_RESULTS = int(os.getenv('ZAI_SEARCH_MAX_RESULTS', '5'))
+    ZAI_SEARCH_MAX_RESULTS = get_int_env('ZAI_SEARCH_MAX_RESULTS', 5)
     ZAI_SEARCH_CONTENT_SIZE = os.getenv('ZAI_SEARCH_CONTENT_SIZE', 'medium')
     ZAI_SEARCH_RECENCY_FILTER = os.getenv('ZAI_SEARCH_RECENCY_FILTER', 'noLimit')
     
@@ -56,10 +76,10 @@ class Config:
     MINERU_API_BASE = os.getenv('MINERU_API_BASE', 'https://mineru.net')
     
     # 知识融合配置
-    KNOWLEDGE_MAX_CONTENT_LENGTH = int(os.getenv('KNOWLEDGE_MAX_CONTENT_LENGTH', '8000'))
-    KNOWLEDGE_MAX_DOC_ITEMS = int(os.getenv('KNOWLEDGE_MAX_DOC_ITEMS', '10'))  # 文档知识最大条目数
-    KNOWLEDGE_CHUNK_SIZE = int(os.getenv('KNOWLEDGE_CHUNK_SIZE', '2000'))  # 知识分块大小（字符）
-    KNOWLEDGE_CHUNK_OVERLAP = int(os.getenv('KNOWLEDGE_CHUNK_OVERLAP', '200'))  # 分块重叠大小
+    KNOWLEDGE_MAX_CONTENT_LENGTH = get_int_env('KNOWLEDGE_MAX_CONTENT_LENGTH', 8000)
+    KNOWLEDGE_MAX_DOC_ITEMS = get_int_env('KNOWLEDGE_MAX_DOC_ITEMS', 10)  # 文档知识最大条目数
+    KNOWLEDGE_CHUNK_SIZE = get_int_env('KNOWLEDGE_CHUNK_SIZE', 2000)  # 知识分块大小（字符）
+    KNOWLEDGE_CHUNK_OVERLAP = get_int_env('KNOWLEDGE_CHUNK_OVERLAP', 200)  # 分块重叠大小
     
     # 多模态模型配置（用于图片摘要）
     IMAGE_CAPTION_MODEL = os.getenv('IMAGE_CAPTION_MODEL', 'qwen3-vl-plus-2025-12-19')
@@ -69,6 +89,8 @@ class Config:
     OSS_ACCESS_KEY_SECRET = os.getenv('OSS_ACCESS_KEY_SECRET', '')
     OSS_BUCKET_NAME = os.getenv('OSS_BUCKET_NAME', '')
     OSS_ENDPOINT = os.getenv('OSS_ENDPOINT', 'oss-cn-hangzhou.aliyuncs.com')
+    OSS_MULTIPART_PART_SIZE = get_int_env('OSS_MULTIPART_PART_SIZE', 8 * 1024 * 1024)  # 大文件分片大小（字节）
+    OSS_MULTIPART_NUM_THREADS = get_int_env('OSS_MULTIPART_NUM_THREADS', 4)  # 分片并发上传线程数
     
     # Veo3 视频生成配置
     VEO3_MODEL = os.getenv('VEO3_MODEL', 'veo3.1-fast')
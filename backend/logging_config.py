@@ -0,0 +1,219 @@
+"""
+vibe-blog 日志配置
+
+所有日志记录先放入内存队列，由后台 QueueListener 线程统一格式化并
+写入控制台/文件，请求线程中不再执行格式化和写文件的 I/O。
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+# 任务 ID 上下文变量（只通过 set_task_id / reset_task_id 读写，保证与显示文本同步）
+_task_id_context: ContextVar[str] = ContextVar('task_id', default='')
+
+# 预先拼好的任务 ID 显示文本（如 "[abc123]"），每条日志直接读取，无需再格式化
+_task_id_display: ContextVar[str] = ContextVar('task_id_display', default='')
+
+# 日志格式
+LOG_FORMAT = '%(asctime)s %(task_id)s - %(name)s - %(levelname)s - %(message)s'
+
+# 日志目录
+LOG_DIR = os.path.join(os.path.dirname(__file__), 'logs')
+
+
+def set_task_id(task_id: str) -> tuple:
+    """
+    设置当前上下文的任务 ID
+
+    同时写入任务 ID 和日志显示文本，所有任务 ID 的写入都应经过本函数。
+
+    Returns:
+        供 reset_task_id 使用的 token
+    """
+    return (
+        _task_id_context.set(task_id),
+        _task_id_display.set(f"[{task_id}]" if task_id else ""),
+    )
+
+
+def reset_task_id(token: tuple):
+    """恢复 set_task_id 之前的任务 ID"""
+    id_token, display_token = token
+    _task_id_display.reset(display_token)
+    _task_id_context.reset(id_token)
+
+
+# 自定义日志过滤器，添加任务 ID
+class TaskIdFilter(logging.Filter):
+    def filter(self, record):
+        record.task_id = _task_id_display.get()
+        return True
+
+
+class CachedFormatter(logging.Formatter):
+    """
+    缓存格式化结果的 Formatter
+
+    控制台和文件 Handler 共用同一个实例，同一条记录第二次格式化时
+    直接返回第一次的结果。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 格式串初始化后不再变化，是否包含 asctime 只需判断一次
+        self._uses_time = self._style.usesTime()
+
+    def usesTime(self):
+        return self._uses_time
+
+    def format(self, record):
+        cached = record.__dict__.get('_formatted')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        text = super().format(record)
+        record._formatted = (self, text)
+        return text
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    带缓冲的文件日志 Handler
+
+    以 64KB 缓冲打开日志文件，不再逐条 flush；仅在距上次刷新超过
+    flush_interval 秒或遇到 ERROR 及以上级别时刷新，把多次小写入
+    合并为一次系统调用。监听队列排空时由 _FlushingQueueListener 调用
+    flush_pending() 写出剩余缓冲，关闭时缓冲会随文件一起写出。
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = 'a',
+        encoding: str = None,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._force_flush = False
+        super().__init__(filename, mode=mode, encoding=encoding)
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode,
+            buffering=self.buffer_size, encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record):
+        self._force_flush = record.levelno >= logging.ERROR
+        super().emit(record)
+
+    def flush(self):
+        now = time.monotonic()
+        if not self._force_flush and now - self._last_flush < self.flush_interval:
+            return
+        super().flush()
+        self._last_flush = now
+
+    def flush_pending(self):
+        """立即写出缓冲中的日志，不受 flush_interval 限制"""
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    队列空闲时刷新文件缓冲的 QueueListener
+
+    一批日志处理完、即将阻塞等待下一条记录前，写出 BufferedFileHandler
+    中剩余的内容，避免服务空闲或卡住时最后几行日志滞留在缓冲里。
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get(block=False)
+        except queue.Empty:
+            pass
+        for handler in self.handlers:
+            if isinstance(handler, BufferedFileHandler):
+                handler.flush_pending()
+        return self.queue.get(block)
+
+
+# 后台日志监听器（全局唯一）
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> Optional[logging.handlers.QueueListener]:
+    """
+    配置根日志器
+
+    根日志器只挂载一个 QueueHandler，实际输出的控制台/文件 Handler
+    由后台 QueueListener 线程驱动。重复调用时只更新根日志器级别。
+
+    Args:
+        level: 根日志器级别
+
+    Returns:
+        QueueListener（Handler 已由其他模块副本挂载时为 None）
+    """
+    global _listener
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+
+    # 已配置过则直接返回，遇到第一个本模块的 Handler 即停止检查
+    if _listener is not None or any(
+        getattr(h, '_vibe_blog_handler', False) for h in root_logger.handlers
+    ):
+        return _listener
+
+    # QueueHandler 入队前已把 msg % args 合并为最终消息，
+    # 这里再让所有 Handler 共享一份格式化结果
+    log_format = CachedFormatter(LOG_FORMAT)
+    handlers = []
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(log_format)
+    handlers.append(console_handler)
+
+    # 尝试配置文件日志，如果失败则跳过（Vercel 环境是只读的）
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        file_handler = BufferedFileHandler(os.path.join(LOG_DIR, 'app.log'), encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(log_format)
+        handlers.append(file_handler)
+    except (OSError, IOError):
+        # Vercel 环境是只读的，无法创建日志文件，仅使用控制台日志
+        pass
+
+    # 任务 ID 保存在 ContextVar 中，必须在产生日志的线程上读取，
+    # 因此过滤器挂在 QueueHandler 上，而不是监听线程里的 Handler
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(TaskIdFilter())
+    queue_handler._vibe_blog_handler = True
+    root_logger.addHandler(queue_handler)
+
+    _listener = _FlushingQueueListener(
+        queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+    # 进程退出前排空队列
+    atexit.register(shutdown_logging)
+
+    return _listener
+
+
+def shutdown_logging():
+    """停止后台监听线程，并写出队列中剩余的日志"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -18,31 +18,44 @@ MAX_WORKERS = int(os.environ.get('BLOG_GENERATOR_MAX_WORKERS', '3'))
 logger = logging.getLogger(__name__)
 
 # ASCII 流程图特征模式（强特征 - 必须出现）
-ASCII_FLOWCHART_STRONG_PATTERNS = [
+ASCII_FLOWCHART_STRONG_PATTERNS = (
     r'\+[-=]+\+',           # +---+ 或 +===+ 边框（流程图典型特征）
     r'[-=]{2,}>',           # ---> 或 ===> 箭头（流程图典型特征）
     r'<[-=]{2,}',           # <--- 反向箭头
-]
+)
 
 # ASCII 流程图特征模式（弱特征 - 辅助判断）
-ASCII_FLOWCHART_WEAK_PATTERNS = [
+ASCII_FLOWCHART_WEAK_PATTERNS = (
     r'\|[^|]{2,}\|',        # | xxx | 内容行
     r'\+-{2,}\+',           # +--+ 连续边框
-]
+)
 
 # Markdown 表格特征（用于排除）
 MARKDOWN_TABLE_PATTERN = r'^\s*\|([^|]+\|)+\s*$'  # | col1 | col2 | 格式
 MARKDOWN_TABLE_SEPARATOR = r'^\s*\|[\s:-]+\|'      # |---|---| 分隔符
 
 # 需要排除的其他模式
-EXCLUDE_PATTERNS = [
+EXCLUDE_PATTERNS = (
     r'^\s*<!--.*-->',           # HTML 注释
     r'^\s*#',                   # Markdown 标题
     r'^\s*[-*]\s+.*-->',        # 列表项中的箭头（如 "- item --> result"）
     r'^\s*\d+\.\s+.*-->',       # 有序列表中的箭头
     r'^\$\$.*\$\$',             # LaTeX 块公式
     r'^\$.*\$$',                # LaTeX 行内公式
-]
+)
+
+
+def _compile_union(patterns) -> re.Pattern:
+    """将一组模式合并为单个预编译正则，逐行检测时只需扫描一次"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+# 预编译的合并模式（模块加载时构建一次）
+_STRONG_RE = _compile_union(ASCII_FLOWCHART_STRONG_PATTERNS)
+_WEAK_RE = _compile_union(ASCII_FLOWCHART_WEAK_PATTERNS)
+_EXCLUDE_RE = _compile_union(
+    (MARKDOWN_TABLE_PATTERN, MARKDOWN_TABLE_SEPARATOR) + EXCLUDE_PATTERNS
+)
 
 
 class ArtistAgent:
@@ -73,6 +86,11 @@ class ArtistAgent:
             - ascii_content: ASCII 图内容
             - original_text: 原始文本（用于替换）
         """
+        # 快速路径：强特征都需要 '+'、'<' 或 '>'，没有这些字符时只有代码块边界
+        # 才可能结束一个区域；连代码块都没有则不可能检测到流程图，无需逐行扫描
+        if '```' not in content and not any(ch in content for ch in '+<>'):
+            return []
+        
         lines = content.split('\n')
         ascii_regions = []
         current_region = {"start_line": -1, "lines": []}
@@ -101,20 +119,15 @@ class ArtistAgent:
                 continue
             
             # 检查是否是需要排除的行
-            is_excluded = (
-                re.match(MARKDOWN_TABLE_PATTERN, line) or 
-                re.match(MARKDOWN_TABLE_SEPARATOR, line) or
-                any(re.match(p, line) for p in EXCLUDE_PATTERNS)
-            )
-            if is_excluded:
+            if _EXCLUDE_RE.match(line):
                 # 如果当前区域有强特征，继续收集；否则跳过
                 if current_region.get("has_strong_feature"):
                     current_region["lines"].append(line)
                 continue
             
             # 计算该行匹配的特征
-            strong_match = any(re.search(p, line) for p in ASCII_FLOWCHART_STRONG_PATTERNS)
-            weak_match = any(re.search(p, line) for p in ASCII_FLOWCHART_WEAK_PATTERNS)
+            strong_match = _STRONG_RE.search(line) is not None
+            weak_match = strong_match or _WEAK_RE.search(line) is not None
             
             if strong_match or weak_match:
                 if current_region["start_line"] == -1:
@@ -4,6 +4,7 @@ Assembler Agent - 文档组装
 
 import logging
 import re
+from itertools import islice
 from typing import Dict, Any, List
 
 from ..prompts.prompt_manager import get_prompt_manager
@@ -14,6 +15,12 @@ from ..utils.helpers import (
 
 logger = logging.getLogger(__name__)
 
+# 匹配 ### 开头的标题（不匹配 #### 及更多）
+SUBHEADING_PATTERN = re.compile(r'^###\s+(.+?)$', re.MULTILINE)
+
+# 每个章节最多提取的二级标题数
+MAX_SUBHEADINGS = 3
+
 
 class AssemblerAgent:
     """
@@ -36,10 +43,11 @@ class AssemblerAgent:
         Returns:
             二级标题列表
         """
-        # 匹配 ### 开头的标题（不匹配 #### 及更多）
-        pattern = r'^###\s+(.+?)$'
-        matches = re.findall(pattern, content, re.MULTILINE)
-        return matches[:3]  # 最多返回 3 个二级标题
+        # 只取前几个匹配，后面的标题不再扫描和构造字符串
+        return [
+            match.group(1)
+            for match in islice(SUBHEADING_PATTERN.finditer(content), MAX_SUBHEADINGS)
+        ]
     
     def assemble(
         self,
@@ -2,14 +2,31 @@
 Reviewer Agent - 质量审核
 """
 
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from typing import Dict, Any
 
 from ..prompts.prompt_manager import get_prompt_manager
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 orjson 解析 LLM 返回的 JSON（C 实现，解析更快），未安装时回退到标准库
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# 审核 Prompt 缓存条数上限
+PROMPT_CACHE_SIZE = 32
+
+# 审核通过的最低分数
+APPROVE_SCORE_THRESHOLD = 91
+
+# LLM 未给出分数或审核失败时使用的默认分数
+DEFAULT_REVIEW_SCORE = 80
+
 
 class ReviewerAgent:
     """
@@ -24,6 +41,42 @@ class ReviewerAgent:
             llm_client: LLM 客户端
         """
         self.llm = llm_client
+        # Prompt 管理器是全局单例，初始化时取一次，审核时不再重复查找
+        self.prompt_manager = get_prompt_manager()
+        # 渲染后的审核 Prompt 缓存: (文档摘要, 大纲摘要) -> prompt
+        self._prompt_cache: OrderedDict = OrderedDict()
+    
+    def _render_prompt(self, document: str, outline: Dict[str, Any]) -> str:
+        """
+        渲染审核 Prompt，修订循环中同一文档被重复审核时复用渲染结果
+        
+        Args:
+            document: 完整文档
+            outline: 原始大纲
+            
+        Returns:
+            渲染后的 Prompt
+        """
+        outline_json = json.dumps(outline, sort_keys=True, ensure_ascii=False, default=str)
+        key = (
+            hashlib.sha1(document.encode('utf-8')).hexdigest(),
+            hashlib.sha1(outline_json.encode('utf-8')).hexdigest(),
+        )
+        
+        prompt = self._prompt_cache.get(key)
+        if prompt is not None:
+            self._prompt_cache.move_to_end(key)
+            return prompt
+        
+        prompt = self.prompt_manager.render_reviewer(
+            document=document,
+            outline=outline
+        )
+        
+        self._prompt_cache[key] = prompt
+        if len(self._prompt_cache) > PROMPT_CACHE_SIZE:
+            self._prompt_cache.popitem(last=False)
+        return prompt
     
     def review(
         self,
@@ -40,11 +93,7 @@ class ReviewerAgent:
         Returns:
             审核结果
         """
-        pm = get_prompt_manager()
-        prompt = pm.render_reviewer(
-            document=document,
-            outline=outline
-        )
+        prompt = self._render_prompt(document, outline)
         
         try:
             response = self.llm.chat(
@@ -52,15 +101,27 @@ class ReviewerAgent:
                 response_format={"type": "json_object"}
             )
             
-            result = json.loads(response)
+            result = _json_loads(response)
             
             # 基于规则二次校验
             issues = result.get("issues", [])
-            score = result.get("score", 80)
-            has_high_issue = any(i.get('severity') == 'high' for i in issues)
+            score = result.get("score", DEFAULT_REVIEW_SCORE)
+            # LLM 可能把分数返回为字符串等非数值，先转换，避免比较时抛异常被当作"默认通过"
+            if not isinstance(score, (int, float)):
+                try:
+                    # 先转 float 以兼容 "92.5" 这类小数字符串
+                    score = int(float(score))
+                except (TypeError, ValueError, OverflowError):
+                    score = DEFAULT_REVIEW_SCORE
             
-            # high 问题直接不通过，或分数低于 91 不通过
-            approved = result.get("approved", True) and not has_high_issue and score >= 91
+            # high 问题直接不通过，或分数低于阈值不通过
+            # 已判定不通过时无需再扫描问题列表；否则遇到第一个 high 即停止
+            approved = result.get("approved", True) and score >= APPROVE_SCORE_THRESHOLD
+            if approved:
+                for issue in issues:
+                    if issue.get('severity') == 'high':
+                        approved = False
+                        break
             
             return {
                 "score": score,
@@ -70,10 +131,10 @@ class ReviewerAgent:
             }
             
         except Exception as e:
-            logger.error(f"审核失败: {e}")
+            logger.error("审核失败: %s", e)
             # 默认通过
             return {
-                "score": 80,
+                "score": DEFAULT_REVIEW_SCORE,
                 "approved": True,
                 "issues": [],
                 "summary": "审核完成"
@@ -90,7 +151,7 @@ class ReviewerAgent:
             更新后的状态
         """
         if state.get('error'):
-            logger.error(f"前置步骤失败，跳过质量审核: {state.get('error')}")
+            logger.error("前置步骤失败，跳过质量审核: %s", state.get('error'))
             state['review_score'] = 0
             state['review_approved'] = False
             state['review_issues'] = []
@@ -107,24 +168,37 @@ class ReviewerAgent:
         outline = state.get('outline', {})
         
         # 组装文档用于审核
-        document_parts = []
-        for section in sections:
-            document_parts.append(f"## {section.get('title', '')}\n\n{section.get('content', '')}")
-        
-        document = '\n\n---\n\n'.join(document_parts)
+        document = '\n\n---\n\n'.join(
+            f"## {section.get('title', '')}\n\n{section.get('content', '')}"
+            for section in sections
+        )
         
         logger.info("开始质量审核")
         
         result = self.review(document, outline)
         
-        state['review_score'] = result.get('score', 80)
+        state['review_score'] = result.get('score', DEFAULT_REVIEW_SCORE)
         state['review_approved'] = result.get('approved', True)
         state['review_issues'] = result.get('issues', [])
         
-        logger.info(f"质量审核完成: 得分 {result.get('score', 0)}, {'通过' if result.get('approved') else '未通过'}")
+        # 审核结论和问题列表合并为一条多行日志，避免每个问题单独走一遍日志管线
+        if logger.isEnabledFor(logging.INFO):
+            lines = [
+                f"质量审核完成: 得分 {result.get('score', 0)}, "
+                f"{'通过' if result.get('approved') else '未通过'}"
+            ]
+            lines.extend(
+                f"  - [{issue.get('severity', 'medium')}] {issue.get('description', '')}"
+                for issue in result.get('issues') or []
+            )
+            logger.info("%s", "\n".join(lines))
         
-        if result.get('issues'):
-            for issue in result['issues']:
-                logger.info(f"  - [{issue.get('severity', 'medium')}] {issue.get('description', '')}")
+        # 每个问题保留一条 DEBUG 记录，便于按问题检索
+        if logger.isEnabledFor(logging.DEBUG):
+            for issue in result.get('issues') or []:
+                logger.debug(
+                    "审核问题: [%s] %s",
+                    issue.get('severity', 'medium'), issue.get('description', '')
+                )
         
         return state
@@ -13,7 +13,7 @@ from contextvars import copy_context
 from .generator import BlogGenerator
 from .schemas.state import create_initial_state
 from .services.search_service import SearchService, init_search_service, get_search_service
-from .post_processors.markdown_formatter import MarkdownFormatter
+from .post_processors.markdown_formatter import get_markdown_formatter
 from ..image_service import get_image_service, AspectRatio, ImageSize
 
 # 输出目录
@@ -113,11 +113,10 @@ class BlogService:
             app: Flask 应用实例
         """
         def run_in_thread():
-            # 导入 task_id_context
-            from app import task_id_context
+            from logging_config import set_task_id, reset_task_id
             
             # 在线程中设置 task_id 上下文
-            token = task_id_context.set(task_id)
+            token = set_task_id(task_id)
             
             try:
                 if app:
@@ -155,7 +154,7 @@ class BlogService:
                     )
             finally:
                 # 重置上下文
-                task_id_context.reset(token)
+                reset_task_id(token)
         
         # 使用 copy_context 确保线程继承当前上下文
         ctx = copy_context()
@@ -906,7 +905,7 @@ class BlogService:
             
             # 后处理：修复分割线前后的换行符
             try:
-                formatter = MarkdownFormatter()
+                formatter = get_markdown_formatter()
                 formatter.process_file(filepath)
                 logger.info(f"Markdown 格式化完成: {filepath}")
             except Exception as format_error:
@@ -6,10 +6,41 @@ Markdown 后处理器：修复分割线前后的换行符问题
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+# 预编译的正则（模块加载时构建一次，所有格式化器实例共享）
+# 分割线模式：匹配 --- 前后没有正确换行的情况
+SEPARATOR_PATTERN = re.compile(
+    r'([^\n])(-{3,})([^\n])',  # 匹配 X---Y 的模式
+    re.MULTILINE
+)
+
+# 标题前分割线模式：匹配 ---## 这样的情况
+SEPARATOR_HEADING_PATTERN = re.compile(
+    r'(-{3,})([#])',  # 匹配 ---# 的模式
+    re.MULTILINE
+)
+
+# 行首分割线后紧跟内容：---## -> ---\n\n##
+_SEPARATOR_PREFIX_RE = re.compile(r'^(---+)([^-\s\n])', re.MULTILINE)
+# 独立的分割线
+_SEPARATOR_LINE_RE = re.compile(r'^(---+)$', re.MULTILINE)
+# 标题前缺少空行：X\n##
+_HEADING_BEFORE_RE = re.compile(r'([^\n])\n(#{1,6}\s)')
+# 标题后缺少空行：##标题\nX
+_HEADING_AFTER_RE = re.compile(r'(#{1,6}\s[^\n]+)\n([^\n\s])')
+
+
+@lru_cache(maxsize=None)
+def _blank_lines_pattern(max_blanks: int) -> re.Pattern:
+    """按需构建并缓存匹配多于 max_blanks 个空行的正则"""
+    # \n{n,} 匹配 n 个或更多换行符
+    return re.compile(r'\n' * (max_blanks + 2) + r'+')
+
+
 class MarkdownFormatter:
     """
     Markdown 格式化器：处理常见的格式问题
@@ -17,17 +48,8 @@ class MarkdownFormatter:
     
     def __init__(self):
         """初始化格式化器"""
-        # 分割线模式：匹配 --- 前后没有正确换行的情况
-        self.separator_pattern = re.compile(
-            r'([^\n])(-{3,})([^\n])',  # 匹配 X---Y 的模式
-            re.MULTILINE
-        )
-        
-        # 标题前分割线模式：匹配 ---## 这样的情况
-        self.separator_heading_pattern = re.compile(
-            r'(-{3,})([#])',  # 匹配 ---# 的模式
-            re.MULTILINE
-        )
+        self.separator_pattern = SEPARATOR_PATTERN
+        self.separator_heading_pattern = SEPARATOR_HEADING_PATTERN
     
     def fix_separator_spacing(self, content: str) -> str:
         """
@@ -43,9 +65,9 @@ class MarkdownFormatter:
         """
         # 行首是 --- 的，拆分并前后加空行
         # 先把 ---## 拆成 ---\n##
-        content = re.sub(r'^(---+)([^-\s\n])', r'\1\n\n\2', content, flags=re.MULTILINE)
+        content = _SEPARATOR_PREFIX_RE.sub(r'\1\n\n\2', content)
         # 再确保独立的 --- 前后有空行
-        content = re.sub(r'^(---+)$', r'\n\1\n', content, flags=re.MULTILINE)
+        content = _SEPARATOR_LINE_RE.sub(r'\n\1\n', content)
         return content
     
     def fix_multiple_blank_lines(self, content: str, max_blanks: int = 2) -> str:
@@ -59,13 +81,12 @@ class MarkdownFormatter:
         Returns:
             str: 修复后的内容
         """
-        # Step 1: 构建正则表达式匹配多于 max_blanks 的空行
-        # \n{n,} 匹配 n 个或更多换行符
-        pattern = r'\n' * (max_blanks + 2) + r'+'
+        # Step 1: 获取匹配多于 max_blanks 个空行的正则（按 max_blanks 缓存）
+        pattern = _blank_lines_pattern(max_blanks)
         replacement = '\n' * (max_blanks + 1)
         
         # Step 2: 替换多余空行
-        content = re.sub(pattern, replacement, content)
+        content = pattern.sub(replacement, content)
         
         return content
     
@@ -81,19 +102,11 @@ class MarkdownFormatter:
         """
         # Step 1: 处理标题前缺少空行的情况
         # 匹配 \n## 这样标题前没有空行的情况
-        content = re.sub(
-            r'([^\n])\n(#{1,6}\s)',  # 匹配 X\n## 的模式
-            r'\1\n\n\2',
-            content
-        )
+        content = _HEADING_BEFORE_RE.sub(r'\1\n\n\2', content)
         
         # Step 2: 处理标题后缺少空行的情况
         # 匹配 ##标题\n非空行 这样标题后没有空行的情况
-        content = re.sub(
-            r'(#{1,6}\s[^\n]+)\n([^\n\s])',  # 匹配 ##标题\nX 的模式
-            r'\1\n\n\2',
-            content
-        )
+        content = _HEADING_AFTER_RE.sub(r'\1\n\n\2', content)
         
         return content
     
@@ -198,6 +211,18 @@ class MarkdownFormatter:
             return 0
 
 
+# 全局实例
+_markdown_formatter: Optional[MarkdownFormatter] = None
+
+
+def get_markdown_formatter() -> MarkdownFormatter:
+    """获取 Markdown 格式化器实例"""
+    global _markdown_formatter
+    if _markdown_formatter is None:
+        _markdown_formatter = MarkdownFormatter()
+    return _markdown_formatter
+
+
 # --- 使用示例 ---
 if __name__ == "__main__":
     import sys
@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 # 模板目录
 TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
 
+# 已编译模板缓存条数
+TEMPLATE_CACHE_SIZE = 200
+
 
 class PromptManager:
     """
@@ -30,11 +33,15 @@ class PromptManager:
         self.templates_dir = templates_dir or TEMPLATES_DIR
         
         # 初始化 Jinja2 环境
+        # 模板随代码发布，运行期不会变化：关闭 auto_reload，
+        # 命中缓存时不再逐次 stat 模板文件检查是否修改
         self.env = Environment(
             loader=FileSystemLoader(self.templates_dir),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
+            cache_size=TEMPLATE_CACHE_SIZE,
+            auto_reload=False,
         )
         
         # 添加自定义过滤器
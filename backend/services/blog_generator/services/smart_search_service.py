@@ -5,6 +5,7 @@
 import json
 import logging
 import os
+import re
 from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -18,25 +19,66 @@ PROFESSIONAL_BLOGS = {
     'langchain': {
         'site': 'blog.langchain.dev',
         'name': 'LangChain Blog',
-        'keywords': ['langchain', 'langgraph', 'lcel', 'langsmith']
+        'keywords': ('langchain', 'langgraph', 'lcel', 'langsmith')
     },
     'anthropic': {
         'site': 'anthropic.com',
         'name': 'Anthropic Research',
-        'keywords': ['claude', 'anthropic', 'constitutional ai', 'rlhf']
+        'keywords': ('claude', 'anthropic', 'constitutional ai', 'rlhf')
     },
     'openai': {
         'site': 'openai.com',
         'name': 'OpenAI Blog',
-        'keywords': ['gpt', 'chatgpt', 'openai', 'dall-e', 'whisper']
+        'keywords': ('gpt', 'chatgpt', 'openai', 'dall-e', 'whisper')
     },
     'jiqizhixin': {
         'site': 'jiqizhixin.com',
         'name': '机器之心',
-        'keywords': ['机器之心', '中文', 'ai资讯']
+        'keywords': ('机器之心', '中文', 'ai资讯')
     }
 }
 
+# 需要检索 arXiv 论文的主题关键词
+ARXIV_KEYWORDS = ('论文', 'paper', '研究', 'research', '算法', 'algorithm', '模型', 'model', 'transformer', 'attention')
+
+
+def _build_keyword_matcher(keyword_sources: Dict[str, List[str]]):
+    """
+    将「关键词 -> 搜索源」表编译为单个正则，一次扫描即可找出所有命中的关键词
+
+    正则使用零宽前瞻，重叠的关键词也能逐一命中；同一位置只会捕获最长的关键词，
+    因此每个关键词的归属源预先并入所有作为其前缀的关键词的归属源。
+
+    Returns:
+        (编译后的正则, 关键词 -> 归属源元组)
+    """
+    owners = {}
+    for keyword in keyword_sources:
+        merged = []
+        for other, sources in keyword_sources.items():
+            if keyword.startswith(other):
+                merged.extend(s for s in sources if s not in merged)
+        owners[keyword] = tuple(merged)
+    
+    alternation = '|'.join(re.escape(k) for k in sorted(owners, key=len, reverse=True))
+    return re.compile(f'(?=({alternation}))'), owners
+
+
+def _routing_keyword_sources() -> Dict[str, List[str]]:
+    """汇总 arXiv 与专业博客的关键词表，同一关键词可归属多个搜索源"""
+    keyword_sources: Dict[str, List[str]] = {}
+    for keyword in ARXIV_KEYWORDS:
+        keyword_sources.setdefault(keyword, []).append('arxiv')
+    for blog_id, config in PROFESSIONAL_BLOGS.items():
+        for keyword in config['keywords']:
+            keyword_sources.setdefault(keyword, []).append(blog_id)
+    return keyword_sources
+
+
+# 路由关键词匹配器（模块加载时构建一次）
+# PROFESSIONAL_BLOGS / ARXIV_KEYWORDS 视为只读常量；运行期若修改关键词，需重新构建匹配器
+_ROUTING_KEYWORD_RE, _ROUTING_KEYWORD_OWNERS = _build_keyword_matcher(_routing_keyword_sources())
+
 # 全局服务实例
 _smart_search_service: Optional['SmartSearchService'] = None
 
@@ -68,7 +110,7 @@ class SmartSearchService:
         Returns:
             合并后的搜索结果
         """
-        logger.info(f"🧠 智能搜索开始: {topic}")
+        logger.info("🧠 智能搜索开始: %s", topic)
         
         # 第一步：LLM 判断需要哪些搜索源
         routing_result = self._route_search_sources(topic)
@@ -77,7 +119,7 @@ class SmartSearchService:
         arxiv_query = routing_result.get('arxiv_query', topic)
         blog_query = routing_result.get('blog_query', topic)
         
-        logger.info(f"🧠 搜索源路由结果: {sources}")
+        logger.info("🧠 搜索源路由结果: %s", sources)
         
         # 第二步：并行执行搜索
         all_results = []
@@ -117,14 +159,14 @@ class SmartSearchService:
                     result = future.result()
                     if result.get('success') and result.get('results'):
                         all_results.extend(result['results'])
-                        logger.info(f"✅ {source_name} 搜索完成: {len(result['results'])} 条结果")
+                        logger.info("✅ %s 搜索完成: %s 条结果", source_name, len(result['results']))
                 except Exception as e:
-                    logger.error(f"❌ {source_name} 搜索失败: {e}")
+                    logger.error("❌ %s 搜索失败: %s", source_name, e)
         
         # 第三步：合并去重
         merged_results = self._merge_and_dedupe(all_results)
         
-        logger.info(f"🧠 智能搜索完成: 共 {len(merged_results)} 条结果")
+        logger.info("🧠 智能搜索完成: 共 %s 条结果", len(merged_results))
         
         return {
             'success': True,
@@ -158,7 +200,7 @@ class SmartSearchService:
             return result
             
         except Exception as e:
-            logger.warning(f"LLM 路由失败，使用规则匹配: {e}")
+            logger.warning("LLM 路由失败，使用规则匹配: %s", e)
             return self._rule_based_routing(topic)
     
     def _rule_based_routing(self, topic: str) -> Dict[str, Any]:
@@ -166,15 +208,17 @@ class SmartSearchService:
         topic_lower = topic.lower()
         sources = ['general']
         
+        # 单次扫描同时收集 arXiv 和专业博客的命中情况
+        matched = set()
+        for match in _ROUTING_KEYWORD_RE.finditer(topic_lower):
+            matched.update(_ROUTING_KEYWORD_OWNERS[match.group(1)])
+        
         # 检查是否需要 arXiv
-        arxiv_keywords = ['论文', 'paper', '研究', 'research', '算法', 'algorithm', '模型', 'model', 'transformer', 'attention']
-        if any(kw in topic_lower for kw in arxiv_keywords):
+        if 'arxiv' in matched:
             sources.append('arxiv')
         
-        # 检查专业博客
-        for blog_id, config in PROFESSIONAL_BLOGS.items():
-            if any(kw in topic_lower for kw in config['keywords']):
-                sources.append(blog_id)
+        # 检查专业博客，按配置顺序输出
+        sources.extend(blog_id for blog_id in PROFESSIONAL_BLOGS if blog_id in matched)
         
         return {
             'sources': sources,
@@ -201,7 +245,7 @@ class SmartSearchService:
         
         # 使用 site: 限定搜索
         site_query = f"{query} site:{blog_config['site']}"
-        logger.info(f"📝 专业博客搜索: {site_query}")
+        logger.info("📝 专业博客搜索: %s", site_query)
         
         result = search_service.search(site_query, max_results)
         
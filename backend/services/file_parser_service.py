@@ -25,6 +25,14 @@ logger = logging.getLogger(__name__)
 _templates_dir = Path(__file__).parent / 'prompts'
 _jinja_env = Environment(loader=FileSystemLoader(str(_templates_dir)))
 
+# 从图片文件名中提取页码的模式（按优先级排列，匹配前文件名已转为小写）
+_PAGE_NUM_PATTERNS = (
+    re.compile(r'page[_-]?(\d+)'),     # page_1, page-1, page1
+    re.compile(r'^(\d+)[_-]'),         # 1_xxx, 1-xxx
+    re.compile(r'[_-]p(\d+)\.'),       # xxx_p1.png
+    re.compile(r'[_-](\d+)\.'),        # xxx_1.png
+)
+
 
 class FileParserService:
     """文件解析服务，支持 MinerU OCR 解析 PDF"""
@@ -427,19 +435,12 @@ class FileParserService:
         Returns:
             页码 (从 1 开始)，如果无法提取则返回 0
         """
-        # 获取文件名（不含路径）
-        basename = os.path.basename(filename)
+        # 获取文件名（不含路径），统一转为小写后匹配，正则无需再做大小写折叠
+        basename = os.path.basename(filename).lower()
         
         # 尝试多种模式
-        patterns = [
-            r'page[_-]?(\d+)',      # page_1, page-1, page1
-            r'^(\d+)[_-]',          # 1_xxx, 1-xxx
-            r'[_-]p(\d+)\.',        # xxx_p1.png
-            r'[_-](\d+)\.',         # xxx_1.png
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, basename, re.IGNORECASE)
+        for pattern in _PAGE_NUM_PATTERNS:
+            match = pattern.search(basename)
             if match:
                 return int(match.group(1))
         
@@ -0,0 +1,27 @@
+"""
+HTTP 连接适配器 - 为 requests 连接池设置 socket 选项
+"""
+import socket
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+# 在 urllib3 默认选项（TCP_NODELAY）基础上开启 TCP keepalive，
+# 长时间轮询/下载期间空闲连接不会被中间设备静默断开
+DEFAULT_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """创建连接时附带自定义 socket 选项的 HTTPAdapter"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+
+    def __init__(self, socket_options=None, **kwargs):
+        self.socket_options = socket_options or DEFAULT_SOCKET_OPTIONS
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
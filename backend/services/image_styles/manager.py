@@ -22,6 +22,9 @@ class ImageStyleManager:
     _instance = None
     _styles: Dict = {}
     _env: Environment = None
+    # 由配置派生的缓存，在 _load_config（含 reload）时重建
+    _default_style_id: str = "cartoon"
+    _templates: Dict = {}
     
     def __new__(cls):
         if cls._instance is None:
@@ -37,6 +40,10 @@ class ImageStyleManager:
                 config = yaml.safe_load(f)
                 self._styles = config.get('styles', {})
             
+            # 默认风格和已编译模板只与配置有关，重新加载时一并失效
+            self._default_style_id = self._find_default_style_id()
+            self._templates = {}
+            
             # 初始化 Jinja2 环境
             self._env = Environment(
                 loader=FileSystemLoader(TEMPLATES_DIR),
@@ -44,10 +51,12 @@ class ImageStyleManager:
                 lstrip_blocks=True
             )
             
-            logger.info(f"已加载 {len(self._styles)} 个图片风格")
+            logger.info("已加载 %s 个图片风格", len(self._styles))
         except Exception as e:
-            logger.error(f"加载风格配置失败: {e}")
+            logger.error("加载风格配置失败: %s", e)
             self._styles = {}
+            self._default_style_id = self._find_default_style_id()
+            self._templates = {}
     
     def reload(self):
         """热重载配置和模板"""
@@ -63,6 +72,10 @@ class ImageStyleManager:
     
     def get_default_style_id(self) -> str:
         """获取默认风格 ID"""
+        return self._default_style_id
+    
+    def _find_default_style_id(self) -> str:
+        """从风格配置中查找默认风格 ID"""
         for style_id, style in self._styles.items():
             if style.get('default'):
                 return style_id
@@ -95,7 +108,7 @@ class ImageStyleManager:
         """
         style = self._styles.get(style_id)
         if not style:
-            logger.warning(f"未找到风格 {style_id}，使用默认风格")
+            logger.warning("未找到风格 %s，使用默认风格", style_id)
             style_id = self.get_default_style_id()
             style = self._styles.get(style_id)
         
@@ -106,10 +119,14 @@ class ImageStyleManager:
         template_file = style.get("template", f"{style_id}.j2")
         
         try:
-            template = self._env.get_template(template_file)
+            # 缓存已加载的模板，避免每次渲染都经过 Jinja2 的缓存查找和文件修改时间检查
+            template = self._templates.get(template_file)
+            if template is None:
+                template = self._env.get_template(template_file)
+                self._templates[template_file] = template
             return template.render(content=content)
         except Exception as e:
-            logger.error(f"渲染模板 {template_file} 失败: {e}")
+            logger.error("渲染模板 %s 失败: %s", template_file, e)
             return content
     
     def is_valid_style(self, style_id: str) -> bool:
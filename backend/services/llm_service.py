@@ -7,6 +7,38 @@ from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# OpenAI 兼容客户端的长连接池配置
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_MAX_CONNECTIONS = 64
+HTTP_TIMEOUT = 60
+
+
+def _create_http_client():
+    """
+    创建共享的 httpx 长连接客户端
+    
+    复用 TCP/TLS 连接，避免每次 LLM 调用重新握手；安装了 h2 时启用 HTTP/2。
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=HTTP_MAX_CONNECTIONS,
+        ),
+        timeout=HTTP_TIMEOUT,
+    )
+
 
 class LLMService:
     """
@@ -43,6 +75,15 @@ class LLMService:
         
         # 懒加载的模型实例
         self._text_chat_model = None
+        # 懒加载的长连接 HTTP 客户端（OpenAI 兼容 API 共用）
+        self._http_client = None
+    
+    @property
+    def http_client(self):
+        """获取共享的长连接 HTTP 客户端"""
+        if self._http_client is None:
+            self._http_client = _create_http_client()
+        return self._http_client
     
     def _create_chat_model(self, model_name: str):
         """创建 LangChain ChatModel 实例"""
@@ -60,6 +101,9 @@ class LLMService:
                     model=model_name,
                     api_key=self._openai_api_key,
                     base_url=self._openai_api_base if self._openai_api_base else None,
+                    http_client=self.http_client,
+                    # openai 客户端按请求传 timeout，会覆盖 http_client 上的设置，需在此显式指定
+                    timeout=HTTP_TIMEOUT,
                     temperature=0.7
                 )
             else:
@@ -5,13 +5,63 @@ Veo3 视频生成 API 需要公网可访问的图片 URL，
 本服务将本地图片上传到 OSS 并返回公网 URL。
 """
 import os
-import uuid
+import secrets
 import logging
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import requests
+
+from .http_adapter import SocketOptionsAdapter
 
 logger = logging.getLogger(__name__)
 
+# 超过该大小的文件走分片断点续传，小文件仍使用单次 put_object
+MULTIPART_THRESHOLD = 10 * 1024 * 1024
+# 默认分片大小与并发分片数（可通过 OSS_MULTIPART_PART_SIZE / OSS_MULTIPART_NUM_THREADS 配置）
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_NUM_THREADS = 4
+# 断点续传记录目录
+RESUMABLE_STORE_ROOT = os.path.join(tempfile.gettempdir(), 'oss_resume')
+# HTTP 连接池大小，突发上传多张配图时复用已建立的 TLS 连接
+HTTP_POOL_SIZE = 32
+# 文件存在性检查结果的缓存时间（秒）与最大条目数
+EXISTS_CACHE_TTL = 60.0
+EXISTS_CACHE_SIZE = 1024
+# 从 URL 转存时每次读取的块大小
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# 按扩展名推断的 Content-Type
+_MIME_BY_EXT = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.mov': 'video/quicktime',
+}
+
+# 远程路径中的日期串缓存: (失效时间戳, 'YYYYMMDD')，跨过本地零点后重新计算
+_date_cache = (0.0, '')
+
+
+def _today() -> str:
+    """返回当天日期串 YYYYMMDD（同一天内只调用一次 strftime）"""
+    global _date_cache
+    expires_at, value = _date_cache
+    if time.time() >= expires_at:
+        now = datetime.now()
+        value = now.strftime('%Y%m%d')
+        tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _date_cache = (tomorrow.timestamp(), value)
+    return value
+
 
 class OSSService:
     """阿里云 OSS 服务"""
@@ -21,7 +71,9 @@ class OSSService:
         access_key_id: str = None,
         access_key_secret: str = None,
         bucket_name: str = None,
-        endpoint: str = None
+        endpoint: str = None,
+        part_size: int = None,
+        num_threads: int = None
     ):
         """
         初始化 OSS 服务
@@ -31,14 +83,28 @@ class OSSService:
             access_key_secret: 阿里云 AccessKey Secret
             bucket_name: OSS Bucket 名称
             endpoint: OSS Endpoint (如 oss-cn-hangzhou.aliyuncs.com)
+            part_size: 大文件分片上传的分片大小（字节）
+            num_threads: 大文件分片并发上传线程数
         """
         self.access_key_id = access_key_id or os.getenv('OSS_ACCESS_KEY_ID')
         self.access_key_secret = access_key_secret or os.getenv('OSS_ACCESS_KEY_SECRET')
         self.bucket_name = bucket_name or os.getenv('OSS_BUCKET_NAME')
         self.endpoint = endpoint or os.getenv('OSS_ENDPOINT', 'oss-cn-hangzhou.aliyuncs.com')
+        self.part_size = part_size or MULTIPART_PART_SIZE
+        self.num_threads = num_threads or MULTIPART_NUM_THREADS
+        # 公网 URL 前缀在进程生命周期内不变，只拼接一次
+        self._url_prefix = f"https://{self.bucket_name}.{self.endpoint}/"
         
         self._bucket = None
+        self._oss2 = None
+        # 从 URL 转存时使用的下载会话（复用连接，开启 TCP keepalive）
+        self._http = requests.Session()
+        self._http.mount('https://', SocketOptionsAdapter())
+        self._http.mount('http://', SocketOptionsAdapter())
         self._initialized = False
+        # remote_path -> (是否存在, 过期时间)，省去重复的 HEAD 请求
+        self._exists_cache: OrderedDict = OrderedDict()
+        self._exists_cache_lock = threading.Lock()
         
         if not all([self.access_key_id, self.access_key_secret, self.bucket_name]):
             logger.warning("OSS 配置不完整，上传功能将不可用")
@@ -51,7 +117,15 @@ class OSSService:
             import oss2
             
             auth = oss2.Auth(self.access_key_id, self.access_key_secret)
-            self._bucket = oss2.Bucket(auth, self.endpoint, self.bucket_name)
+            # 传入 adapter 时 oss2 会同时挂载到 http:// 和 https://（默认 endpoint 不带协议，走 http）
+            session = oss2.Session(adapter=SocketOptionsAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=3
+            ))
+            self._bucket = oss2.Bucket(auth, self.endpoint, self.bucket_name, session=session)
+            # 保存模块引用，上传时无需再次 import
+            self._oss2 = oss2
             self._initialized = True
             logger.info(f"OSS 客户端初始化成功: {self.bucket_name}")
             
@@ -80,11 +154,30 @@ class OSSService:
         if not self.is_available:
             return False
         
+        with self._exists_cache_lock:
+            cached = self._exists_cache.get(remote_path)
+            if cached is not None:
+                if cached[1] > time.monotonic():
+                    self._exists_cache.move_to_end(remote_path)
+                    return cached[0]
+                del self._exists_cache[remote_path]
+        
         try:
-            return self._bucket.object_exists(remote_path)
+            exists = self._bucket.object_exists(remote_path)
         except Exception as e:
             logger.warning(f"检查文件是否存在失败: {e}")
             return False
+        
+        self._set_exists(remote_path, exists)
+        return exists
+    
+    def _set_exists(self, remote_path: str, exists: bool):
+        """记录文件存在状态到缓存"""
+        with self._exists_cache_lock:
+            self._exists_cache[remote_path] = (exists, time.monotonic() + EXISTS_CACHE_TTL)
+            self._exists_cache.move_to_end(remote_path)
+            if len(self._exists_cache) > EXISTS_CACHE_SIZE:
+                self._exists_cache.popitem(last=False)
     
     def upload_file(
         self,
@@ -118,19 +211,17 @@ class OSSService:
             return {'success': False, 'error': f'文件不存在: {local_path}'}
         
         try:
-            import oss2
-            
-            # 生成远程路径
-            if not remote_path:
-                ext = os.path.splitext(local_path)[1]
-                timestamp = datetime.now().strftime('%Y%m%d')
-                unique_id = uuid.uuid4().hex[:8]
+            # 生成远程路径（含随机 ID 的新路径不可能已存在）
+            auto_generated = not remote_path
+            if auto_generated:
+                timestamp = _today()
+                unique_id = secrets.token_hex(4)
                 filename = os.path.basename(local_path)
                 remote_path = f"vibe-blog/images/{timestamp}/{unique_id}_{filename}"
             
             # 检查文件是否已存在
-            if skip_if_exists and self.file_exists(remote_path):
-                url = f"https://{self.bucket_name}.{self.endpoint}/{remote_path}"
+            if skip_if_exists and not auto_generated and self.file_exists(remote_path):
+                url = self._url_prefix + remote_path
                 logger.info(f"文件已存在，跳过上传: {url}")
                 return {
                     'success': True,
@@ -139,32 +230,29 @@ class OSSService:
                     'skipped': True
                 }
             
-            # 设置 Content-Type
+            # 设置 Content-Type（未知扩展名交给 oss2 按对象名推断）
             headers = {}
-            if content_type:
-                headers['Content-Type'] = content_type
-            elif local_path.lower().endswith('.png'):
-                headers['Content-Type'] = 'image/png'
-            elif local_path.lower().endswith(('.jpg', '.jpeg')):
-                headers['Content-Type'] = 'image/jpeg'
-            elif local_path.lower().endswith('.gif'):
-                headers['Content-Type'] = 'image/gif'
-            elif local_path.lower().endswith('.webp'):
-                headers['Content-Type'] = 'image/webp'
-            elif local_path.lower().endswith('.mp4'):
-                headers['Content-Type'] = 'video/mp4'
-            elif local_path.lower().endswith('.webm'):
-                headers['Content-Type'] = 'video/webm'
-            elif local_path.lower().endswith('.mov'):
-                headers['Content-Type'] = 'video/quicktime'
+            mime_type = content_type or _MIME_BY_EXT.get(os.path.splitext(local_path)[1].lower())
+            if mime_type:
+                headers['Content-Type'] = mime_type
             
-            # 上传文件
-            with open(local_path, 'rb') as f:
-                result = self._bucket.put_object(remote_path, f, headers=headers)
+            # 上传文件：大文件分片并发上传，内存中只保留分片缓冲
+            if os.path.getsize(local_path) >= MULTIPART_THRESHOLD:
+                result = self._oss2.resumable_upload(
+                    self._bucket, remote_path, local_path,
+                    headers=headers,
+                    store=self._oss2.ResumableStore(root=RESUMABLE_STORE_ROOT),
+                    multipart_threshold=MULTIPART_THRESHOLD,
+                    part_size=self.part_size,
+                    num_threads=self.num_threads
+                )
+            else:
+                result = self._bucket.put_object_from_file(remote_path, local_path, headers=headers)
             
             if result.status == 200:
+                self._set_exists(remote_path, True)
                 # 构建公网 URL
-                url = f"https://{self.bucket_name}.{self.endpoint}/{remote_path}"
+                url = self._url_prefix + remote_path
                 logger.info(f"文件上传成功: {url}")
                 return {
                     'success': True,
@@ -204,7 +292,8 @@ class OSSService:
             result = self._bucket.put_object(remote_path, data, headers=headers)
             
             if result.status == 200:
-                url = f"https://{self.bucket_name}.{self.endpoint}/{remote_path}"
+                self._set_exists(remote_path, True)
+                url = self._url_prefix + remote_path
                 logger.info(f"数据上传成功: {url}")
                 return {
                     'success': True,
@@ -233,6 +322,7 @@ class OSSService:
         
         try:
             self._bucket.delete_object(remote_path)
+            self._set_exists(remote_path, False)
             logger.info(f"文件删除成功: {remote_path}")
             return True
         except Exception as e:
@@ -249,7 +339,7 @@ class OSSService:
         Returns:
             公网 URL
         """
-        return f"https://{self.bucket_name}.{self.endpoint}/{remote_path}"
+        return self._url_prefix + remote_path
     
     def upload_from_url(
         self,
@@ -272,20 +362,22 @@ class OSSService:
             return {'success': False, 'error': 'OSS 服务不可用'}
         
         try:
-            import requests
-            
-            # 下载文件内容到内存
-            response = requests.get(source_url, timeout=60, stream=True)
-            response.raise_for_status()
-            
-            # 自动检测 Content-Type
-            if not content_type:
-                content_type = response.headers.get('Content-Type', 'application/octet-stream')
-            
-            headers = {'Content-Type': content_type}
-            
-            # 直接上传到 OSS（从内存，不写本地文件）
-            self._bucket.put_object(remote_path, response.content, headers=headers)
+            with self._http.get(source_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                # 自动检测 Content-Type
+                if not content_type:
+                    content_type = response.headers.get('Content-Type', 'application/octet-stream')
+                
+                headers = {'Content-Type': content_type}
+                
+                # 边下载边上传（分块编码），内存中只保留一个块，不写本地文件
+                self._bucket.put_object(
+                    remote_path,
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    headers=headers
+                )
+            self._set_exists(remote_path, True)
             
             public_url = self.get_public_url(remote_path)
             logger.info(f"URL 直接上传 OSS 成功: {source_url[:50]}... -> {public_url}")
@@ -323,8 +415,8 @@ class OSSService:
         ext = os.path.splitext(path)[1] or '.png'
         
         # 生成远程路径
-        timestamp = datetime.now().strftime('%Y%m%d')
-        unique_id = uuid.uuid4().hex[:8]
+        timestamp = _today()
+        unique_id = secrets.token_hex(4)
         filename = f"img_{unique_id}{ext}"
         remote_path = f"vibe-blog/images/{timestamp}/{filename}"
         
@@ -353,8 +445,8 @@ class OSSService:
         ext = os.path.splitext(path)[1] or '.mp4'
         
         # 生成远程路径
-        timestamp = datetime.now().strftime('%Y%m%d')
-        unique_id = uuid.uuid4().hex[:8]
+        timestamp = _today()
+        unique_id = secrets.token_hex(4)
         filename = f"video_{unique_id}{ext}"
         remote_path = f"vibe-blog/videos/{timestamp}/{filename}"
         
@@ -448,7 +540,9 @@ def init_oss_service(config: dict) -> Optional[OSSService]:
         access_key_id=access_key_id,
         access_key_secret=access_key_secret,
         bucket_name=bucket_name,
-        endpoint=config.get('OSS_ENDPOINT', 'oss-cn-hangzhou.aliyuncs.com')
+        endpoint=config.get('OSS_ENDPOINT', 'oss-cn-hangzhou.aliyuncs.com'),
+        part_size=config.get('OSS_MULTIPART_PART_SIZE', MULTIPART_PART_SIZE),
+        num_threads=config.get('OSS_MULTIPART_NUM_THREADS', MULTIPART_NUM_THREADS)
     )
     
     if _oss_service.is_available:
@@ -198,10 +198,13 @@ class PipelineService:
         from services.transform_service import TransformService
         concepts = []
         content_lower = content.lower()
+        # 最多只需要 5 个，凑满即停止扫描
         for keyword in TransformService.METAPHOR_LIBRARY.keys():
             if keyword in content_lower:
                 concepts.append(keyword)
-        return concepts[:5]
+                if len(concepts) == 5:
+                    break
+        return concepts
     
     def _find_metaphors(self, concepts: list) -> dict:
         """查找比喻"""
@@ -9,10 +9,14 @@ import yaml
 import tempfile
 import os
 import re
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 平台配置缓存的文件变更检查间隔（秒），间隔内直接使用缓存，不访问磁盘
+CONFIG_CHECK_INTERVAL = 5.0
+
 
 @dataclass
 class ActionResult:
@@ -228,18 +232,31 @@ class WorkflowEngine:
         self.config_dir = config_dir or os.path.join(
             os.path.dirname(__file__), 'configs'
         )
-        self.configs: dict[str, dict] = {}
+        # platform_id -> (文件修改时间, 上次检查时间, 配置)
+        self.configs: dict[str, tuple[int, float, dict]] = {}
     
     def load_config(self, platform_id: str) -> dict:
-        """加载平台配置"""
-        if platform_id in self.configs:
-            return self.configs[platform_id]
+        """
+        加载平台配置
+        
+        按文件修改时间缓存：配置文件未变化时复用已解析的结果，
+        修改 YAML 后无需重启即可生效。
+        """
+        cached = self.configs.get(platform_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < CONFIG_CHECK_INTERVAL:
+            return cached[2]
         
         config_path = os.path.join(self.config_dir, f'{platform_id}.yaml')
+        mtime = os.stat(config_path).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            self.configs[platform_id] = (mtime, now, cached[2])
+            return cached[2]
+        
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
         
-        self.configs[platform_id] = config
+        self.configs[platform_id] = (mtime, now, config)
         return config
     
     def get_supported_platforms(self) -> list[str]:
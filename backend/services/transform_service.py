@@ -161,10 +161,12 @@ class TransformService:
         concepts = []
         content_lower = content.lower()
         
-        # 从比喻库中匹配
+        # 从比喻库中匹配，最多只需要 5 个，凑满即停止扫描
         for keyword in self.METAPHOR_LIBRARY.keys():
             if keyword in content_lower:
                 concepts.append(keyword)
+                if len(concepts) == 5:
+                    break
         
         # 如果没找到，尝试用 LLM 提取
         if not concepts and self.llm_service:
@@ -3,16 +3,29 @@
 将静态图片转换为动画视频
 """
 import requests
+from urllib3.util.retry import Retry
+import random
 import time
 import os
 import logging
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
+from .http_adapter import SocketOptionsAdapter
+
 logger = logging.getLogger(__name__)
 
+# HTTP 连接池大小
+HTTP_POOL_SIZE = 16
+
+# 任务轮询退避参数：首次间隔、增长倍数、最大间隔（秒）
+POLL_BASE_INTERVAL = 2.0
+POLL_BACKOFF_FACTOR = 1.4
+POLL_MAX_INTERVAL = 30.0
+
 
 class VideoAspectRatio(Enum):
     """支持的视频比例"""
@@ -45,8 +58,9 @@ class Veo3Service:
     ]
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_default_animation_prompt() -> str:
-        """获取默认动画提示词（从 Jinja2 模板加载）"""
+        """获取默认动画提示词（从 Jinja2 模板加载，模板无参数，渲染一次后缓存）"""
         from services.blog_generator.prompts.prompt_manager import get_prompt_manager
         return get_prompt_manager().render_cover_video_prompt()
 
@@ -71,8 +85,15 @@ class Veo3Service:
         self.model = model
         self.output_folder = output_folder
         
+        # 长连接 + 连接级重试：一个任务的数十次轮询复用同一条 TLS 连接
         self.session = requests.Session()
+        self.session.mount('https://', SocketOptionsAdapter(
+            pool_connections=4,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
         self.session.headers.update({
+            "Connection": "keep-alive",
             "Content-Type": "application/json",
             "Authorization": f"Bearer {api_key}"
         })
@@ -230,12 +251,18 @@ class Veo3Service:
         self,
         task_id: str,
         max_wait_time: int = 600,
-        poll_interval: int = 5,
+        poll_interval: float = POLL_BASE_INTERVAL,
         progress_callback: callable = None
     ) -> Dict[str, Any]:
-        """等待任务完成"""
+        """
+        等待任务完成
+
+        轮询间隔从 poll_interval 开始按指数退避增长，上限 POLL_MAX_INTERVAL，
+        并叠加随机抖动，避免固定间隔的大量无效查询。
+        """
         start_time = time.time()
         last_progress = -1
+        attempt = 0
 
         while True:
             elapsed = time.time() - start_time
@@ -269,7 +296,12 @@ class Veo3Service:
             elif result.get('code') == -22:
                 raise RuntimeError(f"任务不存在: {task_id}")
 
-            time.sleep(poll_interval)
+            delay = min(POLL_MAX_INTERVAL, poll_interval * (POLL_BACKOFF_FACTOR ** attempt))
+            delay += random.uniform(0, 1)
+            # 最多睡到截止时间，醒来后直接按超时处理
+            remaining = max_wait_time - (time.time() - start_time)
+            time.sleep(max(0.0, min(delay, remaining + 0.1)))
+            attempt += 1
 
     def _upload_to_oss(self, video_url: str) -> dict:
         """
@@ -0,0 +1,37 @@
+"""
+测试公共 fixture
+
+创建 Flask 应用和加载 Prompt 模板的开销较大，整个测试会话共享一份。
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+@pytest.fixture(scope='session')
+def app():
+    """整个测试会话共享的 Flask 应用"""
+    from app import create_app
+    
+    app = create_app()
+    app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """测试客户端（每个测试独立）"""
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture(scope='session')
+def prompt_manager():
+    """整个测试会话共享的 Prompt 管理器"""
+    from services.blog_generator.prompts import get_prompt_manager
+    
+    return get_prompt_manager()
@@ -10,21 +10,6 @@ from unittest.mock import Mock, patch
 class TestBlogAPI:
     """测试博客生成 API"""
     
-    @pytest.fixture
-    def client(self):
-        """创建测试客户端"""
-        import sys
-        import os
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-        
-        from app import create_app
-        
-        app = create_app()
-        app.config['TESTING'] = True
-        
-        with app.test_client() as client:
-            yield client
-    
     def test_health_check(self, client):
         """测试健康检查"""
         response = client.get('/health')
@@ -91,21 +76,6 @@ class TestBlogAPI:
 class TestBlogSyncAPI:
     """测试同步博客生成 API"""
     
-    @pytest.fixture
-    def client(self):
-        """创建测试客户端"""
-        import sys
-        import os
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-        
-        from app import create_app
-        
-        app = create_app()
-        app.config['TESTING'] = True
-        
-        with app.test_client() as client:
-            yield client
-    
     def test_sync_generate_missing_topic(self, client):
         """测试同步生成缺少 topic"""
         response = client.post(
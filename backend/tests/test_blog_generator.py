@@ -19,12 +19,9 @@ class TestPromptManager:
         
         assert pm1 is pm2
     
-    def test_render_planner_prompt(self):
+    def test_render_planner_prompt(self, prompt_manager):
         """测试 Planner Prompt 渲染"""
-        from services.blog_generator.prompts import get_prompt_manager
-        
-        pm = get_prompt_manager()
-        prompt = pm.render_planner(
+        prompt = prompt_manager.render_planner(
             topic="LangGraph 入门",
             article_type="tutorial",
             target_audience="intermediate",
@@ -38,12 +35,9 @@ class TestPromptManager:
         assert "intermediate" in prompt
         assert "Agent" in prompt
     
-    def test_render_writer_prompt(self):
+    def test_render_writer_prompt(self, prompt_manager):
         """测试 Writer Prompt 渲染"""
-        from services.blog_generator.prompts import get_prompt_manager
-        
-        pm = get_prompt_manager()
-        prompt = pm.render_writer(
+        prompt = prompt_manager.render_writer(
             section_outline={
                 "id": "section_1",
                 "title": "什么是 LangGraph",
@@ -162,9 +156,75 @@ class TestAgents:
         from services.blog_generator.agents import AssemblerAgent
         
         agent = AssemblerAgent()
-        
+
         assert agent is not None
 
+    def test_reviewer_agent_review(self):
+        """测试 Reviewer 审核规则"""
+        from services.blog_generator.agents import ReviewerAgent
+
+        mock_llm = Mock()
+        agent = ReviewerAgent(mock_llm)
+
+        mock_llm.chat.return_value = json.dumps({
+            "score": 95, "approved": True, "issues": [], "summary": "ok"
+        })
+        result = agent.review("文档", {"title": "大纲"})
+        assert result['approved'] is True
+
+        mock_llm.chat.return_value = json.dumps({
+            "score": 95, "approved": True,
+            "issues": [{"severity": "low"}, {"severity": "high"}]
+        })
+        result = agent.review("文档", {"title": "大纲"})
+        assert result['approved'] is False
+        assert len(result['issues']) == 2
+
+        mock_llm.chat.return_value = json.dumps({"score": 85, "approved": True, "issues": []})
+        result = agent.review("文档", {"title": "大纲"})
+        assert result['approved'] is False
+
+        # 非数值分数不应绕过 high 问题检查
+        mock_llm.chat.return_value = json.dumps({
+            "score": "优秀", "approved": True, "issues": [{"severity": "high"}]
+        })
+        result = agent.review("文档", {"title": "大纲"})
+        assert result['approved'] is False
+        assert len(result['issues']) == 1
+
+        mock_llm.chat.return_value = json.dumps({"score": "95", "approved": True, "issues": []})
+        result = agent.review("文档", {"title": "大纲"})
+        assert result['score'] == 95
+        assert result['approved'] is True
+
+        # 小数字符串分数按数值参与阈值判断
+        mock_llm.chat.return_value = json.dumps({"score": "92.5", "approved": True, "issues": []})
+        result = agent.review("文档", {"title": "大纲"})
+        assert result['score'] == 92
+        assert result['approved'] is True
+
+    def test_artist_detect_ascii_flowcharts(self):
+        """测试 ASCII 流程图检测"""
+        from services.blog_generator.agents.artist import ArtistAgent
+
+        agent = ArtistAgent(Mock())
+        content = "\n".join([
+            "介绍",
+            "+-------+     +-------+",
+            "| 输入  | --> | 处理  |",
+            "+-------+     +-------+",
+            "结尾",
+            "| 列1 | 列2 |",
+            "|-----|-----|",
+            "| a   | b   |",
+        ])
+
+        regions = agent.detect_ascii_flowcharts(content)
+
+        assert len(regions) == 1
+        assert regions[0]['start_line'] == 1
+        assert regions[0]['end_line'] == 3
+
 
 class TestBlogGenerator:
     """测试博客生成器"""
@@ -0,0 +1,243 @@
+"""
+可读性检测器测试
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from vibe_reviewer.agents import readability_checker as rc
+from vibe_reviewer.pipeline.readability_analyzer import ReadabilityMetrics
+
+
+_ARTICLE_RE = re.compile(r'<<<ARTICLE id=(\d+)>>>')
+
+
+class FakeLLM:
+    """按 Prompt 中的文章编号返回结果的假 LLM"""
+
+    text_model = 'fake-model'
+
+    def __init__(self, missing_ids=(), bad_ids=()):
+        self.missing_ids = set(missing_ids)
+        self.bad_ids = set(bad_ids)
+        self.prompts = []
+
+    def chat(self, messages):
+        prompt = messages[0]['content']
+        self.prompts.append(prompt)
+        ids = [int(i) for i in _ARTICLE_RE.findall(prompt)]
+        if not ids:
+            return json.dumps({'score': 50, 'level': 'hard', 'summary': 'single'})
+        return json.dumps({'results': [
+            {'id': i, 'score': 'abc' if i in self.bad_ids else 60 + i, 'level': 'normal', 'summary': 'batch'}
+            for i in ids if i not in self.missing_ids
+        ]})
+
+    @property
+    def batch_prompts(self):
+        return [p for p in self.prompts if _ARTICLE_RE.search(p)]
+
+
+class StubAnalyzer:
+    """固定返回中等指标，避免测试依赖分词结果"""
+
+    def analyze(self, content):
+        return ReadabilityMetrics(overall_score=70, difficulty_level='normal')
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch):
+    """每个测试使用独立的结果缓存和熔断器"""
+    monkeypatch.setattr(rc, '_result_cache', rc.OrderedDict())
+    monkeypatch.setattr(rc, '_llm_breaker', rc._CircuitBreaker(fail_max=5, reset_timeout=30))
+
+
+def make_checker(llm):
+    checker = rc.ReadabilityChecker(llm, llm_gate_threshold=0)
+    checker.analyzer = StubAnalyzer()
+    return checker
+
+
+class TestCheckBatch:
+    """测试批量可读性检测"""
+
+    def test_split_batches_by_size_and_chars(self, monkeypatch):
+        """按条数上限和字符预算切分批次"""
+        monkeypatch.setattr(rc, 'MAX_BATCH_SIZE', 2)
+        monkeypatch.setattr(rc, 'MAX_BATCH_CHARS', 100)
+        checker = make_checker(FakeLLM())
+        pending = [(i, 'x' * length, None, None) for i, length in enumerate([10, 10, 10, 95, 30])]
+
+        batches = checker._split_batches(pending)
+
+        assert [[item[0] for item in batch] for batch in batches] == [[0, 1], [2], [3], [4]]
+
+    def test_results_follow_input_order(self):
+        """一次请求返回全部结果，顺序与输入一致"""
+        llm = FakeLLM()
+        results = make_checker(llm).check_batch(['甲。', '乙。', '丙。'])
+
+        assert [r.score for r in results] == [60, 61, 62]
+        assert len(llm.prompts) == 1
+
+    def test_missing_id_falls_back_to_single_check(self):
+        """批量结果缺失的条目单独请求补齐"""
+        llm = FakeLLM(missing_ids={1})
+        results = make_checker(llm).check_batch(['甲。', '乙。', '丙。'])
+
+        assert [r.score for r in results] == [60, 50, 62]
+        assert len(llm.batch_prompts) == 1
+        assert len(llm.prompts) == 2
+
+    def test_bad_item_only_affects_itself(self):
+        """单条结果格式错误时只有该条回退，同批其他结果照常使用"""
+        llm = FakeLLM(bad_ids={0})
+        results = make_checker(llm).check_batch(['甲。', '乙。'])
+
+        assert [r.score for r in results] == [50, 61]
+        assert len(llm.prompts) == 2
+
+    def test_duplicate_contents_evaluated_once(self):
+        """重复内容只发送一次，各位置拿到独立的结果副本"""
+        llm = FakeLLM()
+        results = make_checker(llm).check_batch(['甲。', '乙。', '甲。'])
+
+        assert len(_ARTICLE_RE.findall(llm.prompts[0])) == 2
+        assert [r.score for r in results] == [60, 61, 60]
+        assert results[0] is not results[2]
+
+    def test_results_are_cached(self):
+        """批量结果写入缓存，再次检测不请求 LLM"""
+        llm = FakeLLM()
+        checker = make_checker(llm)
+        checker.check_batch(['甲。', '乙。'])
+
+        results = checker.check_batch(['乙。', '甲。'])
+
+        assert [r.score for r in results] == [61, 60]
+        assert checker.check('甲。').score == 60
+        assert len(llm.prompts) == 1
+
+
+class TestLLMGate:
+    """测试专业指标结论明确时跳过 LLM 的门限"""
+
+    @staticmethod
+    def metrics(**overrides):
+        values = dict(overall_score=90, difficulty_level='normal', has_structure=True, very_long_sentence_ratio=0.0)
+        values.update(overrides)
+        return ReadabilityMetrics(**values)
+
+    @pytest.mark.parametrize('overrides, expected', [
+        ({}, True),
+        ({'overall_score': 89}, False),
+        ({'difficulty_level': 'easy'}, True),
+        ({'difficulty_level': 'hard'}, False),
+        ({'difficulty_level': 'expert'}, False),
+        ({'has_structure': False}, False),
+        ({'very_long_sentence_ratio': 0.05}, False),
+    ])
+    def test_gate_boundaries(self, overrides, expected):
+        """评分达到 90、难度为 easy/normal、结构良好且无超长句时才跳过"""
+        checker = rc.ReadabilityChecker(FakeLLM(), llm_gate_threshold=90)
+
+        assert checker._can_skip_llm(self.metrics(**overrides)) is expected
+
+    def test_zero_threshold_disables_gate(self):
+        """阈值为 0 时总是请求 LLM"""
+        checker = rc.ReadabilityChecker(FakeLLM(), llm_gate_threshold=0)
+
+        assert checker._can_skip_llm(self.metrics(overall_score=100)) is False
+
+    def test_gated_check_skips_llm(self):
+        """跳过 LLM 时返回专业指标结果，不含 LLM 问题"""
+        llm = FakeLLM()
+        checker = rc.ReadabilityChecker(llm, llm_gate_threshold=90)
+        checker.analyzer = SimpleNamespace(analyze=lambda content: self.metrics(overall_score=95))
+
+        result = checker.check('内容。')
+
+        assert result.score == 95
+        assert result.issues == []
+        assert llm.prompts == []
+
+
+class TestCircuitBreaker:
+    """测试 LLM 熔断器"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(rc, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+        return now
+
+    def test_opens_after_fail_max(self, clock):
+        """连续失败达到次数后断开"""
+        breaker = rc._CircuitBreaker(fail_max=2, reset_timeout=30)
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self, clock):
+        """成功后失败计数清零"""
+        breaker = rc._CircuitBreaker(fail_max=2, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.allow()
+
+    def test_half_open_allows_single_probe(self, clock):
+        """冷却结束后只放行一次试探"""
+        breaker = rc._CircuitBreaker(fail_max=1, reset_timeout=30)
+        breaker.record_failure()
+
+        clock[0] += 29
+        assert not breaker.allow()
+        clock[0] += 1
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_probe_failure_reopens(self, clock):
+        """试探失败重新计时"""
+        breaker = rc._CircuitBreaker(fail_max=1, reset_timeout=30)
+        breaker.record_failure()
+        clock[0] += 30
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        clock[0] += 29
+        assert not breaker.allow()
+        clock[0] += 1
+        assert breaker.allow()
+
+    def test_probe_success_closes(self, clock):
+        """试探成功后恢复正常"""
+        breaker = rc._CircuitBreaker(fail_max=1, reset_timeout=30)
+        breaker.record_failure()
+        clock[0] += 30
+        assert breaker.allow()
+
+        breaker.record_success()
+
+        assert breaker.allow()
+        assert breaker.allow()
+
+    def test_empty_response_counts_as_failure(self, monkeypatch):
+        """LLM 返回空结果计为失败，熔断后不再请求"""
+        monkeypatch.setattr(rc, '_llm_breaker', rc._CircuitBreaker(fail_max=2, reset_timeout=30))
+        llm = FakeLLM()
+        llm.chat = lambda messages: llm.prompts.append(messages) or None
+        checker = make_checker(llm)
+
+        results = [checker.check(f'内容{i}。') for i in range(4)]
+
+        assert len(llm.prompts) == 2
+        assert [r.score for r in results] == [70] * 4
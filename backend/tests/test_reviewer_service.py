@@ -0,0 +1,99 @@
+"""
+教程评估服务测试
+"""
+
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from vibe_reviewer import reviewer_service as rs
+from vibe_reviewer.agents import readability_checker as rc
+
+
+_ARTICLE_RE = re.compile(r'<<<ARTICLE id=(\d+)>>>')
+
+
+class FakeLLM:
+    """批量可读性 Prompt 按文章编号返回结果，其余请求返回固定摘要"""
+
+    text_model = 'fake-model'
+
+    def __init__(self):
+        self.prompts = []
+
+    def chat(self, messages, **kwargs):
+        prompt = messages[0]['content']
+        self.prompts.append(prompt)
+        ids = [int(i) for i in _ARTICLE_RE.findall(prompt)]
+        if not ids:
+            return '章节摘要'
+        return json.dumps({'results': [
+            {'id': i, 'score': 60 + i, 'level': 'normal', 'summary': 'batch'} for i in ids
+        ]})
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    """替换数据库、Git 和其他评估 Agent，只保留真实的可读性检测"""
+    monkeypatch.setattr(rc, '_result_cache', rc.OrderedDict())
+    monkeypatch.setattr(rc, '_llm_breaker', rc._CircuitBreaker(fail_max=5, reset_timeout=30))
+    monkeypatch.setattr(rc, 'LLM_GATE_THRESHOLD', 0)
+
+    chapters = [
+        SimpleNamespace(
+            file_path=f'{i}.md', file_name=f'{i}.md', title=f'第{i}章', order=i,
+            content=f'第{i}章的正文内容。' * 10, content_hash=f'hash{i}',
+        )
+        for i in range(3)
+    ]
+
+    tutorial_model = Mock()
+    tutorial_model.get_by_id.return_value = {'git_url': 'https://example.com/repo.git', 'enable_search': False}
+    chapter_model = Mock()
+    chapter_model.create.side_effect = [100, 101, 102]
+    git_service = Mock()
+    git_service.return_value.clone_or_pull.return_value = (str(tmp_path), False)
+    doc_processor = Mock()
+    doc_processor.return_value.scan_directory.return_value = chapters
+
+    monkeypatch.setattr(rs, 'TutorialModel', tutorial_model)
+    monkeypatch.setattr(rs, 'ChapterModel', chapter_model)
+    monkeypatch.setattr(rs, 'IssueModel', Mock())
+    monkeypatch.setattr(rs, 'GitService', git_service)
+    monkeypatch.setattr(rs, 'DocumentProcessor', doc_processor)
+    for name in ('ContentAnalyzer', 'SearchAgent', 'ReferenceManager', 'Questioner',
+                 'DepthChecker', 'QualityReviewer', 'Improver'):
+        agent = Mock()
+        agent.return_value.analyze.return_value = None
+        agent.return_value.question.return_value = None
+        agent.return_value.check.return_value = None
+        agent.return_value.review.return_value = None
+        monkeypatch.setattr(rs, name, agent)
+
+    llm = FakeLLM()
+    svc = rs.ReviewerService(llm_service=llm, repos_dir=str(tmp_path))
+    return SimpleNamespace(service=svc, llm=llm, chapter_model=chapter_model, chapters=chapters)
+
+
+class TestEvaluateTutorial:
+    """测试教程评估流程"""
+
+    def test_readability_checked_in_one_batch(self, service):
+        """所有章节的可读性合并为一次批量请求，结果按章节分发"""
+        result = service.service.evaluate_tutorial_sync(1)
+
+        assert result['evaluated_chapters'] == 3
+        batch_prompts = [p for p in service.llm.prompts if _ARTICLE_RE.search(p)]
+        assert len(batch_prompts) == 1
+        assert _ARTICLE_RE.findall(batch_prompts[0]) == ['0', '1', '2']
+        # 除批量可读性外只有章节摘要请求，没有逐章的可读性请求
+        assert len(service.llm.prompts) == 1 + len(service.chapters)
+
+        scores = {
+            call.kwargs['chapter_id']: call.kwargs['readability_score']
+            for call in service.chapter_model.update_scores.call_args_list
+        }
+        assert scores == {100: 60, 101: 61, 102: 62}
@@ -12,6 +12,10 @@ from ..schemas import ActionableFeedback, DepthCheckResult, QualityReviewResult,
 
 logger = logging.getLogger(__name__)
 
+# 问题严重程度 -> 改进建议优先级（未列出的严重程度为 4）
+_QUALITY_ISSUE_PRIORITY = {'high': 1, 'medium': 2}
+_READABILITY_ISSUE_PRIORITY = {'high': 2, 'medium': 3}
+
 
 class Improver:
     """
@@ -157,9 +161,8 @@ class Improver:
         
         # 从质量审核结果生成
         for issue in quality_result.issues:
-            priority = 1 if issue.severity == 'high' else (2 if issue.severity == 'medium' else 4)
             feedback_list.append(ActionableFeedback(
-                priority=priority,
+                priority=_QUALITY_ISSUE_PRIORITY.get(issue.severity, 4),
                 location=issue.location,
                 issue_type=issue.issue_type,
                 problem=issue.description,
@@ -170,9 +173,8 @@ class Improver:
         
         # 从可读性结果生成
         for issue in readability_result.issues:
-            priority = 2 if issue.severity == 'high' else (3 if issue.severity == 'medium' else 4)
             feedback_list.append(ActionableFeedback(
-                priority=priority,
+                priority=_READABILITY_ISSUE_PRIORITY.get(issue.severity, 4),
                 location=issue.location,
                 issue_type=issue.issue_type,
                 problem=issue.description,
@@ -12,6 +12,12 @@ from ..schemas import QualityReviewResult, ContentIssue
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 orjson 解析 LLM 返回的 JSON（C 实现，解析更快），未安装时回退到标准库
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 class QualityReviewer:
     """
@@ -58,7 +64,7 @@ class QualityReviewer:
             return self._parse_response(response)
             
         except Exception as e:
-            logger.error(f"质量审核失败: {e}")
+            logger.error("质量审核失败: %s", e)
             return self._default_result()
     
     def _parse_response(self, response: str) -> QualityReviewResult:
@@ -75,7 +81,7 @@ class QualityReviewer:
                 end = response.find('```', start)
                 response = response[start:end].strip()
             
-            data = json.loads(response)
+            data = _json_loads(response)
             
             # 解析问题列表
             issues = []
@@ -101,7 +107,7 @@ class QualityReviewer:
             )
             
         except json.JSONDecodeError as e:
-            logger.warning(f"解析质量审核结果失败: {e}")
+            logger.warning("解析质量审核结果失败: %s", e)
             return self._default_result()
     
     def _default_result(self) -> QualityReviewResult:
@@ -12,6 +12,18 @@ from ..schemas import ContentIssue
 
 logger = logging.getLogger(__name__)
 
+# 模糊点类型 -> 严重程度（未列出的类型为 low）
+_ISSUE_TYPE_SEVERITY = {
+    # 高严重度：核心概念模糊、关键步骤缺失
+    'missing_step': 'high',
+    'core_concept_vague': 'high',
+    'no_example': 'high',
+    # 中严重度：解释不足、缺少细节
+    'insufficient_explanation': 'medium',
+    'missing_detail': 'medium',
+    'vague_claim': 'medium',
+}
+
 
 class Questioner:
     """
@@ -109,17 +121,8 @@ class Questioner:
     
     def _determine_severity(self, vague_point: Dict) -> str:
         """根据模糊点类型确定严重程度"""
-        issue_type = vague_point.get('issue_type', '')
-        
-        # 高严重度：核心概念模糊、关键步骤缺失
-        if issue_type in ['missing_step', 'core_concept_vague', 'no_example']:
-            return 'high'
-        # 中严重度：解释不足、缺少细节
-        elif issue_type in ['insufficient_explanation', 'missing_detail', 'vague_claim']:
-            return 'medium'
         # 低严重度：可选优化
-        else:
-            return 'low'
+        return _ISSUE_TYPE_SEVERITY.get(vague_point.get('issue_type', ''), 'low')
     
     def _default_result(self) -> Dict[str, Any]:
         """返回默认结果"""
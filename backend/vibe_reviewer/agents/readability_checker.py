@@ -4,16 +4,149 @@
 结合专业可读性指标（py-readability-metrics）和 LLM 分析
 评估词汇、句法、篇章、表层特征四个维度
 """
+import hashlib
 import json
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import Dict, Any, List, Optional
 
+from config import get_int_env, get_float_env
+
 from ..prompts import get_prompt_manager
 from ..schemas import ReadabilityResult, ContentIssue, ReadabilityLevel
 from ..pipeline.readability_analyzer import get_readability_analyzer, ReadabilityMetrics
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 orjson 解析 LLM 返回的 JSON（C 实现，解析更快），未安装时回退到标准库
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# LLM 评估结果缓存条数上限
+RESULT_CACHE_SIZE = 128
+
+# 批量检测：单次请求最多合并的文章数，以及合并后正文的字符预算
+MAX_BATCH_SIZE = 5
+MAX_BATCH_CHARS = 12000
+
+# LLM 响应中的 Markdown 代码块：优先取 ```json 代码块，其次取第一个代码块
+_JSON_FENCE_RE = re.compile(r'```json(.*?)```', re.DOTALL)
+_FENCE_RE = re.compile(r'```(.*?)```', re.DOTALL)
+
+# LLM 返回的 level 字符串 -> 可读性等级
+_LEVEL_MAP = {level.value: level for level in ReadabilityLevel}
+
+# 专业分析器的难度等级 -> 可读性等级（expert 对应"晦涩"：专业性很强，普通读者难以理解）
+_DIFFICULTY_LEVEL_MAP = {
+    "easy": ReadabilityLevel.EASY,
+    "normal": ReadabilityLevel.NORMAL,
+    "hard": ReadabilityLevel.HARD,
+    "expert": ReadabilityLevel.OBSCURE,
+}
+
+# ContentIssue 前六个位置参数对应的 JSON 字段及默认值
+_ISSUE_FIELDS = (
+    ('issue_type', 'unknown'),
+    ('severity', 'medium'),
+    ('location', ''),
+    ('description', ''),
+    ('suggestion', ''),
+    ('original_text', ''),
+)
+
+# 批量检测时并发请求 LLM 的最大线程数
+MAX_WORKERS = get_int_env('VIBE_REVIEWER_MAX_WORKERS', 3)
+
+# 专业指标评分达到该阈值且没有明显问题时跳过 LLM，直接采用专业指标结果（0 表示关闭）
+LLM_GATE_THRESHOLD = get_int_env('VIBE_REVIEWER_READABILITY_LLM_GATE', 90)
+
+# 可直接采用专业指标结果的难度等级
+_GATE_DIFFICULTY_LEVELS = frozenset(("easy", "normal"))
+
+# LLM 熔断：连续失败达到次数后，在冷却时间内直接使用专业指标结果
+LLM_FAIL_MAX = get_int_env('VIBE_REVIEWER_LLM_FAIL_MAX', 5)
+LLM_RESET_TIMEOUT = get_float_env('VIBE_REVIEWER_LLM_RESET_TIMEOUT', 30.0)
+
+
+class _CircuitBreaker:
+    """
+    简单熔断器（线程安全）
+    
+    连续失败 fail_max 次后断开，reset_timeout 秒内拒绝调用；
+    冷却结束后放行一次试探调用，成功则恢复，失败则重新计时。
+    """
+    
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """是否允许本次调用"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # 冷却结束：放行当前这一次试探，其余调用继续等待下一个冷却周期
+            self._opened_at = now
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning("LLM 连续失败 %s 次，%s 秒内跳过可读性 LLM 分析", self._failures, self.reset_timeout)
+                self._opened_at = time.monotonic()
+
+
+# 检测器实例按评估任务创建，熔断状态需跨实例共享
+_llm_breaker = _CircuitBreaker(LLM_FAIL_MAX, LLM_RESET_TIMEOUT)
+
+# 评估结果缓存: (模型, 内容摘要) -> ReadabilityResult
+# 检测器每次评估任务都会重新创建，缓存放在模块级，重新评估未修改的章节时可直接复用
+_result_cache: OrderedDict = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _copy_result(result: ReadabilityResult) -> ReadabilityResult:
+    """复制评估结果，调用方修改结果不会影响缓存"""
+    return replace(result, issues=[replace(issue) for issue in result.issues])
+
+
+def _get_cached(key: tuple) -> Optional[ReadabilityResult]:
+    """读取缓存的评估结果（返回副本），未命中返回 None"""
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is None:
+            return None
+        _result_cache.move_to_end(key)
+    return _copy_result(cached)
+
+
+def _store_cached(key: tuple, result: ReadabilityResult):
+    """写入评估结果缓存"""
+    with _result_cache_lock:
+        _result_cache[key] = result
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
 
 class ReadabilityChecker:
     """
@@ -22,14 +155,17 @@ class ReadabilityChecker:
     评估内容的可读性，包括词汇、句法、篇章、表层特征
     """
     
-    def __init__(self, llm_service):
+    def __init__(self, llm_service, llm_gate_threshold: int = None):
         """
         初始化可读性检测器
         
         Args:
             llm_service: LLM 服务实例
+            llm_gate_threshold: 跳过 LLM 的专业指标评分阈值
+                               （默认从环境变量 VIBE_REVIEWER_READABILITY_LLM_GATE 读取，0 表示关闭）
         """
         self.llm = llm_service
+        self.llm_gate_threshold = LLM_GATE_THRESHOLD if llm_gate_threshold is None else llm_gate_threshold
         self.pm = get_prompt_manager()
         self.analyzer = get_readability_analyzer()
     
@@ -47,34 +183,212 @@ class ReadabilityChecker:
         """
         # 1. 先使用专业工具计算可读性指标
         metrics = self.analyzer.analyze(content)
-        logger.info(f"专业可读性分析: score={metrics.overall_score}, level={metrics.difficulty_level}")
+        logger.info("专业可读性分析: score=%s, level=%s", metrics.overall_score, metrics.difficulty_level)
         
+        if self._can_skip_llm(metrics):
+            logger.info("专业指标结论明确，跳过 LLM 可读性分析")
+            return self._default_result_with_metrics(metrics)
+        
+        # 指标由内容唯一确定，按 (模型, 内容) 查找已有的 LLM 评估结果
+        key = self._cache_key(content)
+        cached = _get_cached(key)
+        if cached is not None:
+            logger.info("可读性检测命中缓存")
+            return cached
+        
+        return self._check_uncached(content, metrics, key)
+    
+    def _check_uncached(self, content: str, metrics: ReadabilityMetrics, key: tuple) -> ReadabilityResult:
+        """使用已算好的指标和缓存键请求 LLM 评估，成功时写入缓存"""
         # 2. 将指标信息传递给 LLM 进行综合分析
         prompt = self.pm.render_readability_check(content, metrics.to_dict())
         
         try:
-            response = self.llm.chat(
-                messages=[{"role": "user", "content": prompt}]
-            )
+            response = self._chat(prompt)
             
             if not response:
                 return self._default_result_with_metrics(metrics)
             
-            return self._parse_response(response, metrics)
+            result = self._parse_response(response, metrics)
             
         except Exception as e:
-            logger.error(f"可读性检测失败: {e}")
+            logger.error("可读性检测失败: %s", e)
+            return self._default_result_with_metrics(metrics)
+        
+        # 解析失败时退回专业指标结果，不写入缓存，下次重新请求 LLM
+        if result is None:
             return self._default_result_with_metrics(metrics)
+        
+        _store_cached(key, result)
+        return _copy_result(result)
+    
+    def check_batch(self, contents: List[str], max_workers: int = None) -> List[ReadabilityResult]:
+        """
+        批量检查多篇内容的可读性
+        
+        内容相同的条目只评估一次，结果复制给各个重复位置；
+        未命中缓存的内容按数量和字符预算分组，每组合并为一次 LLM 请求，
+        各组请求在线程池中并发执行；批量结果中缺失的条目单独请求补齐。
+        
+        Args:
+            contents: 待检查内容列表
+            max_workers: 最大并发请求数（默认从环境变量 VIBE_REVIEWER_MAX_WORKERS 读取）
+            
+        Returns:
+            与 contents 顺序一致的可读性评估结果列表
+        """
+        results: List[Optional[ReadabilityResult]] = [None] * len(contents)
+        
+        # 1. 按内容摘要去重，本地计算指标，结论明确或命中缓存的直接返回
+        indices_by_key: Dict[tuple, List[int]] = {}
+        pending = []
+        for idx, content in enumerate(contents):
+            key = self._cache_key(content)
+            if key in indices_by_key:
+                indices_by_key[key].append(idx)
+                continue
+            indices_by_key[key] = [idx]
+            
+            metrics = self.analyzer.analyze(content)
+            if self._can_skip_llm(metrics):
+                results[idx] = self._default_result_with_metrics(metrics)
+                continue
+            cached = _get_cached(key)
+            if cached is not None:
+                results[idx] = cached
+            else:
+                pending.append((idx, content, metrics, key))
+        
+        # 2. 分组并发请求 LLM
+        batches = self._split_batches(pending)
+        if max_workers is None:
+            max_workers = MAX_WORKERS
+        
+        if len(batches) <= 1 or max_workers <= 1:
+            for batch in batches:
+                self._check_group(batch, results)
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                futures = [executor.submit(self._check_group, batch, results) for batch in batches]
+                for future in futures:
+                    future.result()
+        
+        # 3. 重复内容复用首次出现位置的结果
+        for indices in indices_by_key.values():
+            first = results[indices[0]]
+            for idx in indices[1:]:
+                results[idx] = _copy_result(first)
+        
+        return results
+    
+    def _check_group(self, batch: List[tuple], results: List[Optional[ReadabilityResult]]):
+        """评估一个批次，结果按下标写入 results（各批次下标互不重叠）"""
+        if len(batch) == 1:
+            idx, content, metrics, key = batch[0]
+            results[idx] = self._check_uncached(content, metrics, key)
+            return
+        
+        parsed = self._request_batch(batch)
+        for idx, content, metrics, key in batch:
+            result = parsed.get(idx)
+            if result is None:
+                results[idx] = self._check_uncached(content, metrics, key)
+            else:
+                _store_cached(key, result)
+                results[idx] = _copy_result(result)
+    
+    def _split_batches(self, pending: List[tuple]) -> List[List[tuple]]:
+        """按条数上限和字符预算切分批次"""
+        batches = []
+        current = []
+        current_chars = 0
+        for item in pending:
+            length = len(item[1] or '')
+            if current and (len(current) >= MAX_BATCH_SIZE or current_chars + length > MAX_BATCH_CHARS):
+                batches.append(current)
+                current = []
+                current_chars = 0
+            current.append(item)
+            current_chars += length
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _request_batch(self, batch: List[tuple]) -> Dict[int, ReadabilityResult]:
+        """
+        一次 LLM 请求评估一批内容
+        
+        Returns:
+            {内容下标: 评估结果}，请求或解析失败时为空
+        """
+        metrics_by_id = {idx: metrics for idx, _, metrics, _ in batch}
+        prompt = self.pm.render_readability_check_batch([
+            {"id": idx, "content": content, "metrics": metrics.to_dict()}
+            for idx, content, metrics, _ in batch
+        ])
+        
+        try:
+            response = self._chat(prompt)
+            if not response:
+                return {}
+            
+            data = _json_loads(self._extract_json(response))
+            items = data.get('results', [])
+        except Exception as e:
+            logger.error("批量可读性检测失败: %s", e)
+            return {}
+        
+        # 逐条构建结果，单条格式错误只让该条回退到单独请求，不影响同批其他结果
+        parsed = {}
+        for item in items:
+            try:
+                idx = int(item.get('id'))
+                if idx in metrics_by_id:
+                    parsed[idx] = self._build_result(item, metrics_by_id[idx])
+            except Exception as e:
+                logger.warning("批量可读性结果条目无效: %s", e)
+        logger.info("批量可读性检测完成: %s/%s", len(parsed), len(batch))
+        return parsed
+    
+    def _chat(self, prompt: str) -> Optional[str]:
+        """经熔断器调用 LLM；熔断中或调用无结果时返回 None"""
+        if not _llm_breaker.allow():
+            logger.info("LLM 熔断中，使用专业指标结果")
+            return None
+        
+        try:
+            response = self.llm.chat(
+                messages=[{"role": "user", "content": prompt}]
+            )
+        except Exception:
+            _llm_breaker.record_failure()
+            raise
+        
+        # LLMService.chat 失败时返回 None 而不抛异常
+        if response:
+            _llm_breaker.record_success()
+        else:
+            _llm_breaker.record_failure()
+        return response
+    
+    def _can_skip_llm(self, metrics: ReadabilityMetrics) -> bool:
+        """专业指标评分足够高、结构良好且没有超长句时，LLM 分析不会改变结论"""
+        return (
+            self.llm_gate_threshold > 0
+            and metrics.overall_score >= self.llm_gate_threshold
+            and metrics.difficulty_level in _GATE_DIFFICULTY_LEVELS
+            and metrics.has_structure
+            and metrics.very_long_sentence_ratio == 0
+        )
+    
+    def _cache_key(self, content: str) -> tuple:
+        """结果缓存键：模型名 + 内容摘要"""
+        model = getattr(self.llm, 'text_model', '') or ''
+        return model, hashlib.sha1((content or '').encode('utf-8')).digest()
     
     def _default_result_with_metrics(self, metrics: ReadabilityMetrics) -> ReadabilityResult:
         """基于专业指标返回默认结果"""
-        level = ReadabilityLevel.NORMAL
-        if metrics.difficulty_level == "easy":
-            level = ReadabilityLevel.EASY
-        elif metrics.difficulty_level == "hard":
-            level = ReadabilityLevel.HARD
-        elif metrics.difficulty_level == "expert":
-            level = ReadabilityLevel.EXPERT
+        level = _DIFFICULTY_LEVEL_MAP.get(metrics.difficulty_level, ReadabilityLevel.NORMAL)
         
         # 构建摘要信息
         summary = f"可读性分析完成。平均句长: {metrics.avg_sentence_length:.0f}字, 建议阅读年级: {metrics.suggested_grade}"
@@ -92,60 +406,51 @@ class ReadabilityChecker:
             surface_score=metrics.overall_score,
         )
     
-    def _parse_response(self, response: str, metrics: ReadabilityMetrics = None) -> ReadabilityResult:
-        """解析 LLM 响应"""
+    def _parse_response(self, response: str, metrics: ReadabilityMetrics = None) -> Optional[ReadabilityResult]:
+        """解析 LLM 响应，JSON 无法解析时返回 None"""
         try:
-            # 提取 JSON
-            response = response.strip()
-            if '```json' in response:
-                start = response.find('```json') + 7
-                end = response.find('```', start)
-                response = response[start:end].strip()
-            elif '```' in response:
-                start = response.find('```') + 3
-                end = response.find('```', start)
-                response = response[start:end].strip()
-            
-            data = json.loads(response)
-            
-            # 解析可读性等级
-            level_str = data.get('level', 'normal')
-            try:
-                level = ReadabilityLevel(level_str)
-            except ValueError:
-                level = ReadabilityLevel.NORMAL
-            
-            # 解析问题列表
-            issues = []
-            for issue in data.get('issues', []):
-                issues.append(ContentIssue(
-                    issue_type=issue.get('issue_type', 'unknown'),
-                    severity=issue.get('severity', 'medium'),
-                    location=issue.get('location', ''),
-                    description=issue.get('description', ''),
-                    suggestion=issue.get('suggestion', ''),
-                    original_text=issue.get('original_text', ''),
-                ))
-            
-            # 如果有专业指标，优先使用专业指标的分数
-            base_score = metrics.overall_score if metrics else 70
-            
-            return ReadabilityResult(
-                score=int(data.get('score', base_score)),
-                level=level,
-                issues=issues,
-                summary=data.get('summary', ''),
-                vocabulary_score=int(data.get('vocabulary_score', base_score)),
-                syntax_score=int(data.get('syntax_score', base_score)),
-                discourse_score=int(data.get('discourse_score', base_score)),
-                surface_score=int(data.get('surface_score', base_score)),
-            )
-            
+            data = _json_loads(self._extract_json(response))
         except json.JSONDecodeError as e:
-            logger.warning(f"解析可读性检测结果失败: {e}")
-            if metrics:
-                return self._default_result_with_metrics(metrics)
-            return self._default_result()
+            logger.warning("解析可读性检测结果失败: %s", e)
+            return None
+        return self._build_result(data, metrics)
+    
+    def _extract_json(self, response: str) -> str:
+        """提取响应中的 JSON 文本（去掉 Markdown 代码块标记）"""
+        response = response.strip()
+        # 直接返回 JSON 对象时无需扫描代码块标记
+        if response.startswith('{'):
+            return response
+        match = _JSON_FENCE_RE.search(response) or _FENCE_RE.search(response)
+        if match:
+            return match.group(1).strip()
+        return response
+    
+    def _build_result(self, data: Dict[str, Any], metrics: ReadabilityMetrics = None) -> ReadabilityResult:
+        """由解析后的 JSON 构建评估结果"""
+        # 解析可读性等级
+        level_str = data.get('level', 'normal')
+        level = _LEVEL_MAP.get(level_str, ReadabilityLevel.NORMAL) if isinstance(level_str, str) else ReadabilityLevel.NORMAL
+        
+        # 解析问题列表
+        issues = [
+            ContentIssue(*[issue.get(name, default) for name, default in _ISSUE_FIELDS])
+            for issue in data.get('issues', [])
+        ]
+        
+        # 如果有专业指标，优先使用专业指标的分数
+        base_score = metrics.overall_score if metrics else 70
+        
+        return ReadabilityResult(
+            score=int(data.get('score', base_score)),
+            level=level,
+            issues=issues,
+            summary=data.get('summary', ''),
+            vocabulary_score=int(data.get('vocabulary_score', base_score)),
+            syntax_score=int(data.get('syntax_score', base_score)),
+            discourse_score=int(data.get('discourse_score', base_score)),
+            surface_score=int(data.get('surface_score', base_score)),
+        )
     
     def _default_result(self) -> ReadabilityResult:
         """返回默认结果"""
@@ -10,10 +10,13 @@
 
 参考: python-readability-cn 的思路，但针对技术博客优化
 """
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +28,64 @@ except ImportError:
     JIEBA_AVAILABLE = False
     logger.warning("jieba 未安装，将使用简化的中文分析")
 
+# 分析结果缓存条数上限
+ANALYSIS_CACHE_SIZE = 64
+
+# 非中文字符（连续片段）
+_NON_CHINESE_RE = re.compile(r'[^\u4e00-\u9fff]+')
+
+# Markdown 清理规则：(预编译正则, 替换文本)，按顺序依次应用
+_MARKDOWN_CLEAN_RULES = (
+    # 移除代码块
+    (re.compile(r'```[\s\S]*?```'), ''),
+    (re.compile(r'`[^`]+`'), ''),
+    # 移除 YAML front matter
+    (re.compile(r'^---[\s\S]*?---'), ''),
+    # 移除链接，保留文字
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),
+    # 移除图片
+    (re.compile(r'!\[([^\]]*)\]\([^)]+\)'), ''),
+    # 移除 HTML 标签
+    (re.compile(r'<[^>]+>'), ''),
+    # 移除标题标记
+    (re.compile(r'^#+\s*', re.MULTILINE), ''),
+    # 移除强调标记
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),
+    (re.compile(r'\*([^*]+)\*'), r'\1'),
+    (re.compile(r'__([^_]+)__'), r'\1'),
+    (re.compile(r'_([^_]+)_'), r'\1'),
+    # 移除列表标记
+    (re.compile(r'^[\s]*[-*+]\s+', re.MULTILINE), ''),
+    (re.compile(r'^[\s]*\d+\.\s+', re.MULTILINE), ''),
+    # 移除引用标记
+    (re.compile(r'^>\s*', re.MULTILINE), ''),
+    # 移除表格
+    (re.compile(r'\|[^\n]+\|'), ''),
+    (re.compile(r'^[-|:\s]+$', re.MULTILINE), ''),
+    # 清理多余空白
+    (re.compile(r'\n{3,}'), '\n\n'),
+)
+
+# 纯空白/标点的分词结果
+_PUNCT_WORD_RE = re.compile(r'^[\s\W]+$')
+
+# 文档结构扫描：标题、无序列表项、有序列表项，一次 finditer 完成分类计数
+_STRUCTURE_RE = re.compile(
+    r'^(?:(?P<heading>#{1,6}\s+)|(?P<bullet>[\s]*[-*+]\s+)|(?P<ordered>[\s]*\d+\.\s+))',
+    re.MULTILINE
+)
+
+# 分句（中英文句号、问号、感叹号）
+_SENTENCE_SPLIT_RE = re.compile(r'[。！？!?]+')
+
+# 分段（空行）
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+
+def _count_chinese_chars(text: str) -> int:
+    """统计中文字符数：一次 C 层替换去掉非中文片段，不为每个字符构建列表"""
+    return len(_NON_CHINESE_RE.sub('', text))
+
 
 @dataclass
 class ReadabilityMetrics:
@@ -95,17 +156,41 @@ class ReadabilityAnalyzer:
         if self.jieba_available:
             # 静默加载 jieba
             jieba.setLogLevel(logging.WARNING)
+        # 分析结果缓存: 文本摘要 -> 指标。分析器是全局单例，会被多个线程共用
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def analyze(self, text: str) -> ReadabilityMetrics:
         """
         分析文本可读性
         
+        同一文本（如重新评估未修改的章节）直接复用缓存的分析结果。
+        
         Args:
             text: 待分析的 Markdown 文本
             
         Returns:
             可读性指标
         """
+        key = hashlib.sha1((text or '').encode('utf-8')).digest()
+        
+        with self._cache_lock:
+            metrics = self._cache.get(key)
+            if metrics is not None:
+                self._cache.move_to_end(key)
+        
+        if metrics is None:
+            metrics = self._analyze(text)
+            with self._cache_lock:
+                self._cache[key] = metrics
+                if len(self._cache) > ANALYSIS_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        # 返回副本，调用方修改结果不会影响缓存
+        return replace(metrics)
+    
+    def _analyze(self, text: str) -> ReadabilityMetrics:
+        """执行可读性分析（不经过缓存）"""
         metrics = ReadabilityMetrics()
         
         if not text or len(text.strip()) < 50:
@@ -134,15 +219,19 @@ class ReadabilityAnalyzer:
     
     def _extract_structure(self, text: str, metrics: ReadabilityMetrics):
         """提取文档结构信息"""
-        # 标题数量
-        metrics.heading_count = len(re.findall(r'^#{1,6}\s+', text, re.MULTILINE))
-        
-        # 列表项数量
-        metrics.list_count = len(re.findall(r'^[\s]*[-*+]\s+', text, re.MULTILINE))
-        metrics.list_count += len(re.findall(r'^[\s]*\d+\.\s+', text, re.MULTILINE))
-        
-        # 代码块数量
-        metrics.code_block_count = len(re.findall(r'```', text)) // 2
+        # 标题数量、列表项数量（单次扫描）
+        heading_count = 0
+        list_count = 0
+        for match in _STRUCTURE_RE.finditer(text):
+            if match.lastgroup == 'heading':
+                heading_count += 1
+            else:
+                list_count += 1
+        metrics.heading_count = heading_count
+        metrics.list_count = list_count
+        
+        # 代码块数量（围栏是固定字面量，直接 str.count 计数，无需走正则引擎）
+        metrics.code_block_count = text.count('```') // 2
         
         # 判断是否有良好结构
         metrics.has_structure = (
@@ -153,58 +242,21 @@ class ReadabilityAnalyzer:
     
     def _clean_markdown(self, text: str) -> str:
         """清理 Markdown 语法，保留纯文本"""
-        # 移除代码块
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        text = re.sub(r'`[^`]+`', '', text)
-        
-        # 移除 YAML front matter
-        text = re.sub(r'^---[\s\S]*?---', '', text)
-        
-        # 移除链接，保留文字
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-        
-        # 移除图片
-        text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', '', text)
-        
-        # 移除 HTML 标签
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # 移除标题标记
-        text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)
-        
-        # 移除强调标记
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        text = re.sub(r'__([^_]+)__', r'\1', text)
-        text = re.sub(r'_([^_]+)_', r'\1', text)
-        
-        # 移除列表标记
-        text = re.sub(r'^[\s]*[-*+]\s+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^[\s]*\d+\.\s+', '', text, flags=re.MULTILINE)
-        
-        # 移除引用标记
-        text = re.sub(r'^>\s*', '', text, flags=re.MULTILINE)
-        
-        # 移除表格
-        text = re.sub(r'\|[^\n]+\|', '', text)
-        text = re.sub(r'^[-|:\s]+$', '', text, flags=re.MULTILINE)
-        
-        # 清理多余空白
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        for pattern, repl in _MARKDOWN_CLEAN_RULES:
+            text = pattern.sub(repl, text)
         
         return text.strip()
     
     def _basic_stats(self, text: str, metrics: ReadabilityMetrics):
         """基础统计"""
         # 中文字符数
-        chinese_chars = re.findall(r'[\u4e00-\u9fff]', text)
-        metrics.char_count = len(chinese_chars)
+        metrics.char_count = _count_chinese_chars(text)
         
         # 分词统计
         if self.jieba_available and metrics.char_count > 0:
             words = list(jieba.cut(text))
             # 过滤空白和标点
-            words = [w for w in words if w.strip() and not re.match(r'^[\s\W]+$', w)]
+            words = [w for w in words if w.strip() and not _PUNCT_WORD_RE.match(w)]
             metrics.word_count = len(words)
         else:
             # 简单估算：中文约 1.5 字/词
@@ -212,51 +264,59 @@ class ReadabilityAnalyzer:
     
     def _sentence_analysis(self, text: str, metrics: ReadabilityMetrics):
         """句子分析"""
-        # 按中文句号、问号、感叹号分句
-        sentences = re.split(r'[。！？!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 5]
-        
-        metrics.sentence_count = len(sentences)
-        
-        if metrics.sentence_count == 0:
-            return
-        
-        # 计算每句的中文字符数
-        sentence_lengths = []
+        # 按中文句号、问号、感叹号分句；过滤、计数和字数累加在同一次遍历中完成
+        sentence_count = 0
+        total_length = 0
         long_count = 0
         very_long_count = 0
         
-        for s in sentences:
+        for s in _SENTENCE_SPLIT_RE.split(text):
+            s = s.strip()
+            if len(s) <= 5:
+                continue
+            
+            sentence_count += 1
             # 只统计中文字符
-            chinese_len = len(re.findall(r'[\u4e00-\u9fff]', s))
-            sentence_lengths.append(chinese_len)
+            chinese_len = _count_chinese_chars(s)
+            total_length += chinese_len
             
             if chinese_len > 40:
                 long_count += 1
             if chinese_len > 60:
                 very_long_count += 1
         
+        metrics.sentence_count = sentence_count
+        
+        if sentence_count == 0:
+            return
+        
         # 平均句长
-        metrics.avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths)
+        metrics.avg_sentence_length = total_length / sentence_count
         
         # 长句比例
-        metrics.long_sentence_ratio = long_count / metrics.sentence_count
-        metrics.very_long_sentence_ratio = very_long_count / metrics.sentence_count
+        metrics.long_sentence_ratio = long_count / sentence_count
+        metrics.very_long_sentence_ratio = very_long_count / sentence_count
     
     def _paragraph_analysis(self, text: str, metrics: ReadabilityMetrics):
         """段落分析"""
-        # 按空行分段
-        paragraphs = re.split(r'\n\s*\n', text)
-        paragraphs = [p.strip() for p in paragraphs if p.strip() and len(p.strip()) > 10]
+        # 按空行分段，同时累加段落的中文字符数
+        paragraph_count = 0
+        total_length = 0
+        
+        for p in _PARAGRAPH_SPLIT_RE.split(text):
+            p = p.strip()
+            if len(p) <= 10:
+                continue
+            paragraph_count += 1
+            total_length += _count_chinese_chars(p)
         
-        metrics.paragraph_count = len(paragraphs)
+        metrics.paragraph_count = paragraph_count
         
-        if metrics.paragraph_count == 0:
+        if paragraph_count == 0:
             return
         
         # 计算平均段落长度（中文字符）
-        para_lengths = [len(re.findall(r'[\u4e00-\u9fff]', p)) for p in paragraphs]
-        metrics.avg_paragraph_length = sum(para_lengths) / len(para_lengths)
+        metrics.avg_paragraph_length = total_length / paragraph_count
     
     def _calculate_score(self, metrics: ReadabilityMetrics):
         """
@@ -50,9 +50,12 @@ class ReferenceManager:
         
         evaluated_results = []
         
+        # 摘要侧的小写文本/词集合对所有结果相同，只计算一次
+        summary_ctx = self._build_summary_context(summary)
+        
         for result in results:
             # 简单的相关性评估 (基于关键词匹配)
-            score = self._calculate_relevance(result, summary)
+            score = self._calculate_relevance(result, summary, summary_ctx)
             result.relevance_score = score
             evaluated_results.append(result)
         
@@ -61,34 +64,47 @@ class ReferenceManager:
         
         return evaluated_results
     
-    def _calculate_relevance(self, result: SearchResult, summary: ContentSummary) -> float:
+    def _build_summary_context(self, summary: ContentSummary) -> Dict[str, Any]:
+        """预先计算摘要侧的小写主题、术语和观点词集合"""
+        return {
+            'topic': summary.topic.lower() if summary.topic else '',
+            'terms': [term.lower() for term in summary.key_terms],
+            'point_words': [set(point.lower().split()) for point in summary.core_points],
+        }
+    
+    def _calculate_relevance(
+        self,
+        result: SearchResult,
+        summary: ContentSummary,
+        summary_ctx: Optional[Dict[str, Any]] = None
+    ) -> float:
         """计算相关性得分"""
+        if summary_ctx is None:
+            summary_ctx = self._build_summary_context(summary)
+        
         score = 0.0
         
         text = (result.title + ' ' + result.snippet).lower()
         
         # 主题匹配
-        if summary.topic and summary.topic.lower() in text:
+        if summary_ctx['topic'] and summary_ctx['topic'] in text:
             score += 0.3
         
         # 关键术语匹配
-        matched_terms = 0
-        for term in summary.key_terms:
-            if term.lower() in text:
-                matched_terms += 1
-        if summary.key_terms:
-            score += 0.4 * (matched_terms / len(summary.key_terms))
-        
-        # 核心观点匹配
-        matched_points = 0
-        for point in summary.core_points:
-            # 简单的词重叠检查
-            point_words = set(point.lower().split())
+        terms = summary_ctx['terms']
+        if terms:
+            matched_terms = sum(1 for term in terms if term in text)
+            score += 0.4 * (matched_terms / len(terms))
+        
+        # 核心观点匹配（简单的词重叠检查）
+        point_words_list = summary_ctx['point_words']
+        if point_words_list:
             text_words = set(text.split())
-            if len(point_words & text_words) >= 2:
-                matched_points += 1
-        if summary.core_points:
-            score += 0.3 * (matched_points / len(summary.core_points))
+            matched_points = sum(
+                1 for point_words in point_words_list
+                if len(point_words & text_words) >= 2
+            )
+            score += 0.3 * (matched_points / len(point_words_list))
         
         return min(score, 1.0)
     
@@ -63,6 +63,22 @@ WEIGHT_CONFIGS = {
     },
 }
 
+# 参与加权总分的维度（顺序固定），以及权重配置缺失某维度时的默认权重
+WEIGHTED_DIMENSIONS = ('depth', 'accuracy', 'completeness', 'logic', 'readability')
+DEFAULT_DIMENSION_WEIGHT = 0.2
+
+
+def _weight_vector(weights: Dict[str, float]) -> tuple:
+    """将权重配置展开为按 WEIGHTED_DIMENSIONS 排列的元组"""
+    return tuple(weights.get(dim, DEFAULT_DIMENSION_WEIGHT) for dim in WEIGHTED_DIMENSIONS)
+
+
+# 各内容类型的权重向量（模块加载时展开一次）
+_WEIGHT_VECTORS = {
+    content_type: _weight_vector(weights)
+    for content_type, weights in WEIGHT_CONFIGS.items()
+}
+
 
 class ScoreAggregator:
     """
@@ -79,6 +95,7 @@ class ScoreAggregator:
             custom_weights: 自定义权重配置
         """
         self.custom_weights = custom_weights
+        self._custom_vector = _weight_vector(custom_weights) if custom_weights else None
     
     def aggregate(
         self,
@@ -99,9 +116,9 @@ class ScoreAggregator:
         Returns:
             (overall_score, dimension_scores)
         """
-        # 获取权重配置
-        weights = self.custom_weights or WEIGHT_CONFIGS.get(
-            content_type, WEIGHT_CONFIGS[ContentType.UNKNOWN]
+        # 获取权重向量
+        weights = self._custom_vector or _WEIGHT_VECTORS.get(
+            content_type, _WEIGHT_VECTORS[ContentType.UNKNOWN]
         )
         
         # 构建维度分数
@@ -116,14 +133,15 @@ class ScoreAggregator:
             readability=readability_result.score,
         )
         
-        # 计算加权总分
-        overall_score = (
-            weights.get('depth', 0.2) * depth_result.score +
-            weights.get('accuracy', 0.2) * quality_result.accuracy_score +
-            weights.get('completeness', 0.2) * quality_result.completeness_score +
-            weights.get('logic', 0.2) * quality_result.logic_score +
-            weights.get('readability', 0.2) * readability_result.score
+        # 计算加权总分（与 WEIGHTED_DIMENSIONS 顺序一致）
+        scores = (
+            depth_result.score,
+            quality_result.accuracy_score,
+            quality_result.completeness_score,
+            quality_result.logic_score,
+            readability_result.score,
         )
+        overall_score = sum(w * v for w, v in zip(weights, scores))
         
         return int(overall_score), dimension_scores
     
@@ -18,7 +18,7 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 # 需要过滤的文件名模式
-IGNORE_PATTERNS = [
+IGNORE_PATTERNS = (
     r'^README\.md$',
     r'^CHANGELOG\.md$',
     r'^CONTRIBUTING\.md$',
@@ -26,10 +26,10 @@ IGNORE_PATTERNS = [
     r'^CODE_OF_CONDUCT\.md$',
     r'^SECURITY\.md$',
     r'^\..*',  # 隐藏文件
-]
+)
 
-# 需要过滤的目录
-IGNORE_DIRS = [
+# 需要过滤的目录（frozenset，os.walk 中逐个目录做成员判断）
+IGNORE_DIRS = frozenset({
     '.git',
     'node_modules',
     '__pycache__',
@@ -37,7 +37,7 @@ IGNORE_DIRS = [
     'venv',
     '.idea',
     '.vscode',
-]
+})
 
 
 @dataclass
@@ -63,9 +63,13 @@ class DocumentProcessor:
             include_readme: 是否包含 README.md
         """
         self.include_readme = include_readme
-        self.ignore_patterns = IGNORE_PATTERNS.copy()
+        self.ignore_patterns = IGNORE_PATTERNS
         if include_readme:
-            self.ignore_patterns = [p for p in self.ignore_patterns if 'README' not in p]
+            self.ignore_patterns = tuple(p for p in self.ignore_patterns if 'README' not in p)
+        # 所有忽略模式合并为一个正则，每个文件名只需匹配一次
+        self._ignore_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.ignore_patterns), re.IGNORECASE
+        )
     
     def scan_directory(self, repo_path: str) -> List[MarkdownFile]:
         """
@@ -100,7 +104,7 @@ class DocumentProcessor:
                     if md_file:
                         md_files.append(md_file)
                 except Exception as e:
-                    logger.warning(f"解析文件失败: {rel_path}, 错误: {e}")
+                    logger.warning("解析文件失败: %s, 错误: %s", rel_path, e)
         
         # 按路径排序
         md_files.sort(key=lambda f: f.file_path)
@@ -109,20 +113,23 @@ class DocumentProcessor:
         for i, md_file in enumerate(md_files):
             md_file.order = i
         
-        logger.info(f"扫描完成: 找到 {len(md_files)} 个 Markdown 文件")
+        logger.info("扫描完成: 找到 %s 个 Markdown 文件", len(md_files))
         return md_files
     
     def _should_ignore(self, filename: str) -> bool:
         """检查文件是否应该被忽略"""
-        for pattern in self.ignore_patterns:
-            if re.match(pattern, filename, re.IGNORECASE):
-                return True
-        return False
+        return self._ignore_re.match(filename) is not None
     
     def _parse_file(self, full_path: str, rel_path: str, file_name: str) -> Optional[MarkdownFile]:
         """解析单个 Markdown 文件"""
-        with open(full_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # 以字节读取：解码一次得到文本，MD5 直接使用原始字节，无需再整体编码一遍
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+        content = raw.decode('utf-8')
+        if b'\r' in raw:
+            # 与文本模式读取保持一致：统一换行符（哈希也基于统一后的内容）
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+            raw = content.encode('utf-8')
         
         # 空文件跳过
         if not content.strip():
@@ -132,7 +139,7 @@ class DocumentProcessor:
         title = self._extract_title(content)
         
         # 计算 MD5
-        content_hash = hashlib.md5(content.encode('utf-8')).hexdigest()
+        content_hash = hashlib.md5(raw).hexdigest()
         
         # 计算字数 (中文按字符，英文按单词)
         word_count = self._count_words(content)
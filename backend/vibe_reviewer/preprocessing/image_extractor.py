@@ -16,6 +16,14 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Markdown 图片语法: ![alt](src)
+_MARKDOWN_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+# HTML img 标签
+_HTML_IMAGE_RE = re.compile(
+    r'<img[^>]+src=["\']([^"\']+)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>',
+    re.IGNORECASE
+)
+
 
 @dataclass
 class ImageInfo:
@@ -45,39 +53,39 @@ class ImageExtractor:
         Returns:
             图片信息列表
         """
+        # 单次遍历各行，两种语法分别收集，最后按原顺序（先 Markdown 后 HTML）合并
         images = []
+        html_images = []
         
-        # 匹配 Markdown 图片语法: ![alt](src)
-        pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-        
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            for match in re.finditer(pattern, line):
-                alt_text = match.group(1)
-                src = match.group(2).strip()
-                
-                # 移除可能的标题部分 ![alt](src "title")
-                if ' ' in src:
-                    src = src.split(' ')[0]
-                if '"' in src:
-                    src = src.split('"')[0].strip()
-                
-                image_info = self._parse_image(alt_text, src, base_path, line_num)
-                if image_info:
-                    images.append(image_info)
+        for line_num, line in enumerate(content.split('\n'), 1):
+            # 先用字面量快速判断，绝大多数不含图片的行无需进入正则引擎
+            if '![' in line:
+                for match in _MARKDOWN_IMAGE_RE.finditer(line):
+                    alt_text = match.group(1)
+                    src = match.group(2).strip()
+                    
+                    # 移除可能的标题部分 ![alt](src "title")
+                    if ' ' in src:
+                        src = src.split(' ')[0]
+                    if '"' in src:
+                        src = src.split('"')[0].strip()
+                    
+                    image_info = self._parse_image(alt_text, src, base_path, line_num)
+                    if image_info:
+                        images.append(image_info)
+            
+            if '<' in line:
+                for match in _HTML_IMAGE_RE.finditer(line):
+                    src = match.group(1)
+                    alt_text = match.group(2) or ''
+                    
+                    image_info = self._parse_image(alt_text, src, base_path, line_num)
+                    if image_info:
+                        html_images.append(image_info)
         
-        # 匹配 HTML img 标签
-        html_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>'
-        for line_num, line in enumerate(lines, 1):
-            for match in re.finditer(html_pattern, line, re.IGNORECASE):
-                src = match.group(1)
-                alt_text = match.group(2) or ''
-                
-                image_info = self._parse_image(alt_text, src, base_path, line_num)
-                if image_info:
-                    images.append(image_info)
+        images.extend(html_images)
         
-        logger.debug(f"提取到 {len(images)} 张图片")
+        logger.debug("提取到 %s 张图片", len(images))
         return images
     
     def _parse_image(self, alt_text: str, src: str, base_path: str, position: int) -> Optional[ImageInfo]:
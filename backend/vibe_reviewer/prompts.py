@@ -8,7 +8,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,7 @@ def get_jinja_env() -> Environment:
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=False,
         )
     return _jinja_env
 
@@ -37,6 +38,21 @@ class PromptManager:
     
     def __init__(self):
         self.env = get_jinja_env()
+        # 已编译模板：模板名 -> Template，每个模板只加载编译一次
+        self._templates: Dict[str, Template] = {}
+    
+    def get_template(self, template_name: str) -> Template:
+        """
+        获取已编译的模板
+        
+        Args:
+            template_name: 模板名称 (不含 .j2 后缀)
+        """
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self.env.get_template(f"{template_name}.j2")
+            self._templates[template_name] = template
+        return template
     
     def render(self, template_name: str, **kwargs) -> str:
         """
@@ -49,8 +65,7 @@ class PromptManager:
         Returns:
             渲染后的 Prompt
         """
-        template = self.env.get_template(f"{template_name}.j2")
-        return template.render(**kwargs)
+        return self.get_template(template_name).render(**kwargs)
     
     def render_analyze(self, content: str) -> str:
         """渲染内容分析 Prompt"""
@@ -68,6 +83,15 @@ class PromptManager:
         """渲染可读性检测 Prompt"""
         return self.render("readability_check", content=content, metrics=metrics or {})
     
+    def render_readability_check_batch(self, items: list) -> str:
+        """
+        渲染批量可读性检测 Prompt
+        
+        Args:
+            items: [{"id": 编号, "content": 内容, "metrics": 可读性指标}, ...]
+        """
+        return self.render("readability_check_batch", items=items)
+    
     def render_questioner(self, content: str, content_type: str = "tutorial", context: Dict = None) -> str:
         """渲染追问检查 Prompt"""
         return self.render("questioner", content=content, content_type=content_type, context=context or {})
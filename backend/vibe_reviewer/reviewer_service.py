@@ -4,11 +4,15 @@ vibe-reviewer 主服务
 提供教程评估的核心功能入口
 """
 import os
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
 
+from config import get_int_env
+
 from .models.reviewer_models import (
     init_reviewer_tables,
     TutorialModel,
@@ -37,6 +41,9 @@ from .agents.improver import Improver
 
 logger = logging.getLogger(__name__)
 
+# 从环境变量读取并行配置，默认为 3
+MAX_WORKERS = get_int_env('VIBE_REVIEWER_MAX_WORKERS', 3)
+
 # 全局服务实例
 _reviewer_service: Optional['ReviewerService'] = None
 
@@ -335,32 +342,30 @@ class ReviewerService:
             
             # ========== Step 4.0: 生成章节摘要（用于上下文连贯性检测）==========
             emit("log", level="info", message="📝 正在生成章节摘要...")
-            chapter_summaries = []
-            for idx, chapter in enumerate(chapters_to_evaluate):
-                # 使用 LLM 生成简短摘要
-                if self.llm_service:
-                    try:
-                        summary_prompt = f"请用1-2句话概括以下内容的核心主题和要点（不超过100字）：\n\n{chapter['content'][:2000]}"
-                        chapter_summary = self.llm_service.chat(
-                            messages=[{"role": "user", "content": summary_prompt}]
-                        )
-                        chapter_summaries.append({
-                            'title': chapter['title'] or chapter['file_path'],
-                            'summary': chapter_summary[:200] if chapter_summary else ''
-                        })
-                    except Exception as e:
-                        logger.warning(f"生成章节摘要失败: {e}")
-                        chapter_summaries.append({
-                            'title': chapter['title'] or chapter['file_path'],
-                            'summary': ''
-                        })
-                else:
-                    chapter_summaries.append({
-                        'title': chapter['title'] or chapter['file_path'],
-                        'summary': ''
-                    })
+            if self.llm_service and chapters_to_evaluate:
+                # 各章节摘要相互独立，并行调用 LLM（map 保持章节顺序）
+                max_workers = min(MAX_WORKERS, len(chapters_to_evaluate))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    chapter_summaries = list(executor.map(self._summarize_chapter, chapters_to_evaluate))
+            else:
+                chapter_summaries = [
+                    {'title': chapter['title'] or chapter['file_path'], 'summary': ''}
+                    for chapter in chapters_to_evaluate
+                ]
             emit("log", level="success", message=f"✅ 章节摘要生成完成: {len(chapter_summaries)} 个")
             
+            # ========== Step 4.0.1: 批量可读性检测 ==========
+            # 可读性检测只依赖章节正文，所有章节合并为少量批量请求，逐章评估时直接取结果
+            readability_results = [None] * len(chapters_to_evaluate)
+            if readability_checker and chapters_to_evaluate:
+                emit("log", level="info", message="📖 正在批量检测可读性...")
+                try:
+                    readability_results = readability_checker.check_batch(
+                        [chapter['content'] for chapter in chapters_to_evaluate]
+                    )
+                except Exception as e:
+                    logger.warning("批量可读性检测失败，改为逐章检测: %s", e)
+            
             for idx, chapter in enumerate(chapters_to_evaluate):
                 chapter_id = chapter['id']
                 content = chapter['content']
@@ -433,7 +438,9 @@ class ReviewerService:
                     # 4.5 可读性检测
                     emit("log", level="info", message="   📖 正在检测可读性...")
                     emit("chapter_step", chapter_id=chapter_id, step="readability", status="start")
-                    readability_result = readability_checker.check(content) if readability_checker else None
+                    readability_result = readability_results[idx]
+                    if readability_result is None and readability_checker:
+                        readability_result = readability_checker.check(content)
                     emit("chapter_step", chapter_id=chapter_id, step="readability", status="complete")
                     if readability_result:
                         emit("log", level="info", message=f"   ✓ 可读性检测完成: 评分={readability_result.score}, 级别={readability_result.level.value}")
@@ -630,6 +637,30 @@ class ReviewerService:
             emit("error", message=str(e))
             raise
     
+    def _summarize_chapter(self, chapter: Dict) -> Dict:
+        """
+        使用 LLM 生成章节简短摘要
+        
+        Args:
+            chapter: 章节信息 (包含 title/file_path/content)
+            
+        Returns:
+            {'title': ..., 'summary': ...}，失败时 summary 为空
+        """
+        title = chapter['title'] or chapter['file_path']
+        try:
+            summary_prompt = f"请用1-2句话概括以下内容的核心主题和要点（不超过100字）：\n\n{chapter['content'][:2000]}"
+            chapter_summary = self.llm_service.chat(
+                messages=[{"role": "user", "content": summary_prompt}]
+            )
+            return {
+                'title': title,
+                'summary': chapter_summary[:200] if chapter_summary else ''
+            }
+        except Exception as e:
+            logger.warning(f"生成章节摘要失败: {e}")
+            return {'title': title, 'summary': ''}
+    
     async def evaluate_tutorial(
         self, 
         tutorial_id: int,
@@ -645,8 +676,11 @@ class ReviewerService:
         Returns:
             评估结果
         """
-        # 调用同步版本
-        return self.evaluate_tutorial_sync(tutorial_id, on_progress)
+        # 同步评估包含分词统计等 CPU 密集步骤和阻塞的 LLM 调用，放到线程池执行，避免阻塞事件循环
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.evaluate_tutorial_sync, tutorial_id, on_progress
+        )
 
 
 def init_reviewer_service(llm_service=None, search_service=None, repos_dir: str = None):